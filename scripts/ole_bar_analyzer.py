@@ -10,6 +10,7 @@ This ensures all analysis uses AmiBroker's actual AFL engine — the same
 source as backtests — for full confidence in results.
 """
 
+import calendar
 import csv
 import logging
 import re
@@ -304,15 +305,15 @@ def _expand_includes(afl_content: str) -> str:
 def _unix_to_datenum_timenum(unix_ts: int) -> tuple[int, int]:
     """Convert Unix timestamp to AmiBroker DateNum and TimeNum.
 
-    AmiBroker's ``DateNum()`` / ``TimeNum()`` reflect the **system local
-    timezone** (matching the Windows timezone setting on the machine where
-    AmiBroker runs).  The conversion must therefore use local time — not
-    UTC — to produce values that match the AmiBroker Exploration output.
+    Chart bar times encode AmiBroker's naive quotation timestamps as if
+    they were UTC (see ``ole_stock_data._epoch_seconds``), so decoding in
+    UTC recovers the wall-clock ``DateNum()`` / ``TimeNum()`` values
+    regardless of the host's timezone.
 
     DateNum format: 1YYMMDD for years 2000+ (e.g. 1260210 = Feb 10, 2026)
     TimeNum format: HHMMSS  (e.g. 204200 = 8:42:00 PM)
     """
-    dt = datetime.fromtimestamp(unix_ts)
+    dt = datetime.fromtimestamp(unix_ts, timezone.utc)
     year = dt.year
     if year >= 2000:
         datenum = 1000000 + (year - 2000) * 10000 + dt.month * 100 + dt.day
@@ -801,8 +802,8 @@ def analyze_bar(
 
     # ── Convert timestamp to AmiBroker date/time ──
     datenum, timenum = _unix_to_datenum_timenum(target_unix_ts)
-    target_dt = datetime.fromtimestamp(target_unix_ts)
-    logger.info("Target bar: %s local (DateNum=%d, TimeNum=%d)",
+    target_dt = datetime.fromtimestamp(target_unix_ts, timezone.utc)
+    logger.info("Target bar: %s (DateNum=%d, TimeNum=%d)",
                 target_dt.strftime("%Y-%m-%d %H:%M:%S"), datenum, timenum)
 
     # ── Generate Exploration AFL ──
@@ -1159,19 +1160,20 @@ def _parse_signal_csv(csv_path: str) -> dict:
         short_signals = []
 
         for row in rows:
-            # Parse Date/Time to Unix timestamp
+            # Parse Date/Time to Unix timestamp, reading the naive
+            # AmiBroker time as UTC to match the chart bar times.
             # AmiBroker CSV format: "MM/DD/YYYY HH:MM:SS" (24h)
             dt_str = row.get("Date/Time", "").strip()
             unix_ts = None
             if dt_str:
                 try:
                     dt = datetime.strptime(dt_str, "%m/%d/%Y %H:%M:%S")
-                    unix_ts = int(dt.timestamp())
+                    unix_ts = calendar.timegm(dt.timetuple())
                 except ValueError:
                     # Try date-only format
                     try:
                         dt = datetime.strptime(dt_str, "%m/%d/%Y")
-                        unix_ts = int(dt.timestamp())
+                        unix_ts = calendar.timegm(dt.timetuple())
                     except ValueError:
                         logger.warning("Cannot parse Date/Time: %s", dt_str)
                         continue
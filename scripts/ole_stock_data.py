@@ -6,16 +6,36 @@ COM/OLE Automation, aggregates quotation data into candlestick bars at a
 configurable interval, and caches results to JSON files for fast lookups.
 """
 
+import gzip
 import json
 import logging
+import operator
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pythoncom
 import win32com.client
 
+try:
+    import numba
+except ImportError:  # optional -- bar aggregation falls back to pandas groupby
+    numba = None
+
+try:
+    import orjson
+except ImportError:  # optional -- chart cache falls back to stdlib json
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional -- chart cache falls back to gzip
+    zstandard = None
+
 # ---------------------------------------------------------------------------
 # Project imports
 # ---------------------------------------------------------------------------
@@ -31,15 +51,33 @@ logger = logging.getLogger(__name__)
 
 # OLE Automation Date epoch: 30 December 1899
 _OLE_EPOCH = datetime(1899, 12, 30)
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+
+# Field order of an output bar; also the key set of a columnar ("soa") payload
+_BAR_FIELDS = ("time", "open", "high", "low", "close", "volume")
+_LAYOUTS = ("aos", "soa")
+
+# Reads a Quotation's price/volume fields as one tuple, in _BAR_FIELDS order
+_QUOTATION_VALUES = operator.attrgetter("Open", "High", "Low", "Close", "Volume")
+
+# Below this magnitude float32 spacing is at most 2**-7, so the round-trip
+# error (half that) stays under 0.005 and the final round(..., 2) snaps a
+# cent-grid price back to its original value.  Off-grid quotes (half-cent
+# or 1/64 ticks) can cross a rounding boundary instead, so they are only
+# narrowed after _on_cent_grid confirms there are none.
+_FLOAT32_PRICE_LIMIT = 2.0 ** 17
 
-# Pandas resample rule strings keyed by interval-in-seconds
-_INTERVAL_TO_PANDAS = {
-    60: "1min",
-    300: "5min",
-    600: "10min",
-    3600: "1h",
-    86400: "1D",
-}
+
+def _on_cent_grid(values: np.ndarray) -> bool:
+    """Return True if every price in *values* is a whole number of cents.
+
+    The tolerance only absorbs float64 noise in the ``* 100`` (e.g.
+    3427.37 * 100 == 342737.00000000006); a half-cent is far outside it.
+    """
+    cents = np.asarray(values, dtype=np.float64) * 100
+    return bool(np.all(np.abs(cents - np.round(cents)) < 1e-6))
 
 
 def _com_date_to_datetime(com_date) -> datetime:
@@ -55,6 +93,175 @@ def _com_date_to_datetime(com_date) -> datetime:
     return _OLE_EPOCH + timedelta(days=float(com_date))
 
 
+def _end_of_day(date_str: str) -> datetime:
+    """Parse ``YYYY-MM-DD`` into 23:59:59 on that day.
+
+    The fixed-width form is sliced directly; anything else goes through
+    ``strptime`` so its leniency (e.g. unpadded months) is unchanged.
+    Raises ValueError for an invalid date.
+    """
+    if (
+        len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+        and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+    ):
+        return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]), 23, 59, 59)
+    return datetime.strptime(date_str, "%Y-%m-%d").replace(hour=23, minute=59, second=59)
+
+
+def _epoch_seconds(dt: datetime) -> int:
+    """Epoch seconds of a naive datetime, read as wall-clock time.
+
+    Matches the ``time`` values pandas produces for bars (naive timestamps
+    are treated as UTC), independent of the host's local timezone.
+    """
+    return int((dt - _UNIX_EPOCH).total_seconds())
+
+
+def aos_from_soa(columns: dict) -> list[dict]:
+    """Convert a columnar bar payload into a list of per-bar dicts.
+
+    *columns* maps each of ``time, open, high, low, close, volume`` to an
+    equal-length NumPy array.  Use this only at a boundary that genuinely
+    needs one dict per bar (e.g. ``jsonify``); everything else should pass
+    the arrays through untouched.
+    """
+    return list(_iter_bars(columns))
+
+
+def _iter_bars(columns: dict):
+    """Yield the bars of a columnar payload one dict at a time."""
+    times = np.asarray(columns["time"], dtype=np.int64).tolist()
+    values = [np.asarray(columns[f], dtype=np.float64).tolist() for f in _BAR_FIELDS[1:]]
+    for t, o, h, l, c, v in zip(times, *values):
+        yield {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+
+
+def _empty_columns() -> dict:
+    """Return a zero-length columnar bar payload."""
+    return {
+        f: np.empty(0, dtype=np.int64 if f == "time" else np.float64)
+        for f in _BAR_FIELDS
+    }
+
+
+def _soa_from_aos(bars: list[dict]) -> dict:
+    """Inverse of :func:`aos_from_soa`."""
+    return {
+        "time": np.fromiter((b["time"] for b in bars), dtype=np.int64, count=len(bars)),
+        **{
+            f: np.fromiter((b[f] for b in bars), dtype=np.float64, count=len(bars))
+            for f in _BAR_FIELDS[1:]
+        },
+    }
+
+
+def _tick_columns(raw_ticks) -> dict:
+    """Return raw ticks as columns: ``datetime`` (datetime64[us]) plus OHLCV.
+
+    :meth:`StockDataFetcher._read_quotations` already produces this layout;
+    a list of per-tick dicts (``datetime``, ``open`` ... ``volume``) is
+    converted so callers holding tick dicts keep working.
+    """
+    if isinstance(raw_ticks, dict):
+        return raw_ticks
+    n = len(raw_ticks)
+    ticks = {
+        "datetime": np.array([t["datetime"] for t in raw_ticks], dtype="datetime64[us]"),
+    }
+    for f in _BAR_FIELDS[1:]:
+        ticks[f] = np.fromiter((t[f] for t in raw_ticks), dtype=np.float64, count=n)
+    return ticks
+
+
+# Symbol -> (count, last bar date, {index: bar datetime}) for quotation
+# dates already read by :meth:`StockDataFetcher._bisect_quotations`.
+# Repeat searches over the same symbol walk the same midpoints, so most
+# probes are answered here instead of crossing the COM boundary again.
+_PROBE_CACHE: dict[str, tuple[int, datetime, dict[int, datetime]]] = {}
+_PROBE_CACHE_LOCK = threading.Lock()
+
+
+def _quotation_probes(symbol: str, count: int, last_dt: datetime) -> dict[int, datetime]:
+    """Return the probe cache for *symbol*, resetting it if the data changed.
+
+    A changed bar count or last-bar date means quotations were appended or
+    the database was reloaded, so every cached index may now be stale.
+    """
+    with _PROBE_CACHE_LOCK:
+        entry = _PROBE_CACHE.get(symbol)
+        if entry is None or entry[0] != count or entry[1] != last_dt:
+            entry = (count, last_dt, {count - 1: last_dt})
+            _PROBE_CACHE[symbol] = entry
+        return entry[2]
+
+
+def _reset_probe_cache() -> None:
+    """Forget all cached bisection probes (e.g. after a database reload)."""
+    with _PROBE_CACHE_LOCK:
+        _PROBE_CACHE.clear()
+
+
+def _bucket_ohlcv_kernel(buckets, opens, highs, lows, closes, volumes):
+    """Single pass over time-sorted ticks -> one OHLCV row per bucket.
+
+    *buckets* must be non-decreasing and the value arrays NaN-free.
+    Returns ``(bucket, open, high, low, close, volume)`` arrays.  Compiled
+    with Numba when it is installed; otherwise unused.
+    """
+    n = len(buckets)
+    out_b = np.empty(n, dtype=np.int64)
+    out_o = np.empty(n, dtype=np.float64)
+    out_h = np.empty(n, dtype=np.float64)
+    out_l = np.empty(n, dtype=np.float64)
+    out_c = np.empty(n, dtype=np.float64)
+    out_v = np.empty(n, dtype=np.float64)
+    m = -1
+    for i in range(n):
+        if m < 0 or buckets[i] != out_b[m]:
+            m += 1
+            out_b[m] = buckets[i]
+            out_o[m] = opens[i]
+            out_h[m] = highs[i]
+            out_l[m] = lows[i]
+            out_v[m] = 0.0
+        else:
+            if highs[i] > out_h[m]:
+                out_h[m] = highs[i]
+            if lows[i] < out_l[m]:
+                out_l[m] = lows[i]
+        out_c[m] = closes[i]
+        out_v[m] += volumes[i]
+    m += 1
+    return out_b[:m], out_o[:m], out_h[:m], out_l[:m], out_c[:m], out_v[:m]
+
+
+if numba is not None:
+    _bucket_ohlcv_kernel = numba.njit(cache=True)(_bucket_ohlcv_kernel)
+
+
+def _early_bound(dispatch):
+    """Upgrade a late-bound COM object to makepy early binding if possible.
+
+    A late-bound ``CDispatch`` resolves every property name through an
+    extra ``GetIDsOfNames`` round-trip on each new object, so reading a
+    quotation's six fields costs twelve cross-process calls per bar.  The
+    makepy wrapper generated from AmiBroker's type library already knows
+    the DISPIDs, which halves that to one ``Invoke`` per field; objects
+    returned through it (Stocks, Quotations, each Quotation) are wrapped
+    the same way.  Anything that is not a plain ``CDispatch`` -- including
+    an already early-bound wrapper -- is returned unchanged, as is the
+    late-bound object when the type library can't be loaded.
+    """
+    if not isinstance(dispatch, win32com.client.CDispatch):
+        return dispatch
+    try:
+        from win32com.client import gencache
+        return gencache.EnsureDispatch(dispatch)
+    except Exception as exc:
+        logger.warning("Early binding unavailable, using late-bound COM: %s", exc)
+        return dispatch
+
+
 class StockDataFetcher:
     """Read OHLCV quotation data from an already-running AmiBroker instance.
 
@@ -66,6 +273,7 @@ class StockDataFetcher:
     def __init__(self) -> None:
         self.ab = None
         self._com_initialized = False
+        self._stocks: dict = {}
 
     # ------------------------------------------------------------------
     # Connection
@@ -85,7 +293,7 @@ class StockDataFetcher:
             self._com_initialized = True
 
             logger.info("Attaching to running AmiBroker via COM (%s) ...", AMIBROKER_EXE)
-            self.ab = win32com.client.Dispatch(AMIBROKER_EXE)
+            self.ab = _early_bound(win32com.client.Dispatch(AMIBROKER_EXE))
             logger.info("Attached to AmiBroker successfully.")
             return True
         except Exception as exc:
@@ -94,10 +302,27 @@ class StockDataFetcher:
             return False
 
     def load_database(self, db_path: str = None) -> bool:
-        """Load an AmiBroker database (defaults to ``AMIBROKER_DB_PATH``)."""
+        """Load an AmiBroker database (defaults to ``AMIBROKER_DB_PATH``).
+
+        Skips ``LoadDatabase`` when AmiBroker already has *path* open, which
+        makes this cheap to call before every request on a reused
+        connection.
+        """
         path = db_path or AMIBROKER_DB_PATH
+        try:
+            current = self.ab.DatabasePath
+            if isinstance(current, str) and (
+                Path(current).resolve() == Path(path).resolve()
+            ):
+                return True
+        except Exception:
+            pass  # fall through to an explicit load
         try:
             logger.info("Loading database: %s", path)
+            self._stocks.clear()
+            # Probes are keyed by symbol only; a different database's
+            # bars must not steer the next bisection.
+            _reset_probe_cache()
             self.ab.LoadDatabase(path)
             logger.info("Database loaded.")
             return True
@@ -108,6 +333,7 @@ class StockDataFetcher:
     def disconnect(self) -> None:
         """Release the COM reference (does **not** quit AmiBroker)."""
         self.ab = None
+        self._stocks.clear()
         if self._com_initialized:
             try:
                 pythoncom.CoUninitialize()
@@ -120,12 +346,28 @@ class StockDataFetcher:
     # Data retrieval
     # ------------------------------------------------------------------
 
+    def stock(self, symbol: str):
+        """Return the ``Stock`` COM object for *symbol*, or None if absent.
+
+        Handles are kept for the life of the connection (cleared when a
+        database is loaded), so repeat requests for a symbol skip the
+        ``Stocks()`` dispatch.  The ``Quotations`` collection read through
+        them is live, so appended bars are still seen.
+        """
+        stock = self._stocks.get(symbol)
+        if stock is None:
+            stock = self.ab.Stocks(symbol)
+            if stock is not None:
+                self._stocks[symbol] = stock
+        return stock
+
     def fetch_ohlcv(
         self,
         symbol: str,
         start_dt: datetime,
         end_dt: datetime,
         interval: int = 60,
+        layout: str = "aos",
     ) -> dict:
         """Fetch quotations and return OHLCV bars at the requested *interval*.
 
@@ -137,6 +379,10 @@ class StockDataFetcher:
             Date/time window (inclusive) for the returned bars.
         interval : int
             Target bar size in seconds (60, 300, 600, 86400).  Defaults to 60.
+        layout : str
+            ``"aos"`` (default) returns a list of per-bar dicts; ``"soa"``
+            returns a dict of NumPy arrays keyed by ``time, open, high, low,
+            close, volume`` and skips the per-bar dict construction.
 
         Returns
         -------
@@ -144,13 +390,17 @@ class StockDataFetcher:
             ``{"data": [<bar>, ...], "error": None}`` on success, or
             ``{"data": [], "error": "message"}`` on failure.
             Each bar is ``{"time": <epoch_sec>, "open", "high", "low",
-            "close", "volume"}``.
+            "close", "volume"}``.  With ``layout="soa"`` ``data`` is the
+            columnar dict instead.
         """
+        if layout not in _LAYOUTS:
+            raise ValueError(f"layout must be one of {_LAYOUTS}, got {layout!r}")
+
         if self.ab is None:
             return {"data": [], "error": "Not connected to AmiBroker."}
 
         try:
-            stock = self.ab.Stocks(symbol)
+            stock = self.stock(symbol)
         except Exception as exc:
             return {"data": [], "error": f"COM error accessing symbol '{symbol}': {exc}"}
 
@@ -169,32 +419,21 @@ class StockDataFetcher:
         logger.info("Reading %d quotations for %s ...", count, symbol)
 
         # --- Find the start index via binary search ---
-        start_idx = self._bisect_quotations(quotations, count, start_dt)
+        try:
+            last_dt = _com_date_to_datetime(quotations(count - 1).Date)
+        except Exception as exc:
+            return {"data": [], "error": f"Cannot read quotations for '{symbol}': {exc}"}
+        probes = _quotation_probes(symbol, count, last_dt)
+        start_idx = self._bisect_quotations(quotations, count, start_dt, probes)
 
         # --- Collect raw ticks within the window ---
-        raw_ticks = []
-        for i in range(start_idx, count):
-            q = quotations(i)
-            bar_dt = _com_date_to_datetime(q.Date)
-
-            if bar_dt > end_dt:
-                break
-            if bar_dt < start_dt:
-                continue
-
-            raw_ticks.append({
-                "datetime": bar_dt,
-                "open": float(q.Open),
-                "high": float(q.High),
-                "low": float(q.Low),
-                "close": float(q.Close),
-                "volume": float(q.Volume),
-            })
+        raw_ticks = self._read_quotations(quotations, start_idx, count, start_dt, end_dt)
+        n_ticks = len(raw_ticks["datetime"])
 
-        logger.info("Collected %d raw ticks in window.", len(raw_ticks))
+        logger.info("Collected %d raw ticks in window.", n_ticks)
 
-        if not raw_ticks:
-            return {"data": [], "error": None}
+        if not n_ticks:
+            return {"data": _empty_columns() if layout == "soa" else [], "error": None}
 
         # --- Detect source interval and aggregate as needed ---
         source_interval = self.detect_data_interval(raw_ticks)
@@ -203,12 +442,18 @@ class StockDataFetcher:
         if source_interval > 0 and source_interval >= interval:
             # Source already matches or exceeds target — format without
             # re-aggregation (can't disaggregate coarser bars).
-            bars = self._format_bars(raw_ticks)
+            if layout == "soa":
+                bars = self._format_columns(raw_ticks)
+            else:
+                bars = self._format_bars(raw_ticks)
+        elif layout == "soa":
+            bars = self._aggregate_columns(raw_ticks, interval)
         else:
             # Source is finer-grained than target — aggregate up.
             bars = self._aggregate_bars(raw_ticks, interval)
 
-        logger.info("Produced %d bars at %ds interval.", len(bars), interval)
+        n_bars = len(bars["time"]) if layout == "soa" else len(bars)
+        logger.info("Produced %d bars at %ds interval.", n_bars, interval)
         return {"data": bars, "error": None}
 
     # ------------------------------------------------------------------
@@ -216,20 +461,107 @@ class StockDataFetcher:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _bisect_quotations(quotations, count: int, target_dt: datetime) -> int:
-        """Binary search for the first quotation at or after *target_dt*."""
-        lo, hi = 0, count - 1
-        while lo < hi:
-            mid = (lo + hi) // 2
-            mid_dt = _com_date_to_datetime(quotations(mid).Date)
-            if mid_dt < target_dt:
-                lo = mid + 1
+    def _read_quotations(
+        quotations,
+        start_idx: int,
+        stop_idx: int,
+        start_dt: datetime | None = None,
+        end_dt: datetime | None = None,
+    ) -> dict:
+        """Read quotations ``[start_idx, stop_idx)`` into raw tick columns.
+
+        Reading stops at the first quotation after *end_dt*; quotations
+        before *start_dt* are skipped.  This is the only loop that crosses
+        the COM boundary once per bar, so every bulk read goes through it.
+
+        Returns a dict of NumPy arrays: ``datetime`` (datetime64[us]) and
+        ``open, high, low, close, volume`` (float64).  The loop only appends
+        plain ints and tuples; the arrays are built once afterwards.
+        """
+        # Dates are compared and stored as integer microseconds since the
+        # OLE epoch, so an OLE float date costs one multiply instead of a
+        # timedelta/datetime allocation; the datetime64 column is built in
+        # a single vectorised add after the loop.
+        lo = (start_dt - _OLE_EPOCH) // _ONE_US if start_dt is not None else -(1 << 62)
+        hi = (end_dt - _OLE_EPOCH) // _ONE_US if end_dt is not None else 1 << 62
+        float_dates = None
+
+        # Everything the loop touches is bound to a local up front.
+        read_values = _QUOTATION_VALUES
+        ole_epoch, one_us, us_per_day = _OLE_EPOCH, _ONE_US, _US_PER_DAY
+        ole_us, rows = [], []
+        append_us, append_row = ole_us.append, rows.append
+
+        for i in range(start_idx, stop_idx):
+            q = quotations(i)
+            com_date = q.Date
+            if float_dates is None:
+                # Every quotation comes back the same way, so check once.
+                float_dates = not isinstance(com_date, datetime)
+            if float_dates:
+                us = round(float(com_date) * us_per_day)
             else:
-                hi = mid
-        return lo
+                us = (com_date.replace(tzinfo=None) - ole_epoch) // one_us
+
+            if us > hi:
+                break
+            if us < lo:
+                continue
+
+            append_us(us)
+            append_row(read_values(q))
+
+        n_fields = len(_BAR_FIELDS) - 1
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), n_fields)
+        times = np.datetime64(_OLE_EPOCH, "us") + np.array(ole_us, dtype="timedelta64[us]")
+        ticks = {"datetime": times}
+        for col, f in enumerate(_BAR_FIELDS[1:]):
+            ticks[f] = np.ascontiguousarray(values[:, col])
+        return ticks
+
+    @staticmethod
+    def _bisect_quotations(
+        quotations,
+        count: int,
+        target_dt: datetime,
+        probes: dict[int, datetime] | None = None,
+    ) -> int:
+        """Binary search for the first quotation at or after *target_dt*.
+
+        *probes* (see :func:`_quotation_probes`) maps already-read indices
+        to their dates; it is consulted before, and filled after, each COM
+        read.
+        """
+        if probes is None:
+            probes = {}
+
+        def probe(i: int) -> datetime:
+            dt = probes.get(i)
+            if dt is None:
+                dt = probes[i] = _com_date_to_datetime(quotations(i).Date)
+            return dt
+
+        # Windows that start at either end of the history (a full-range
+        # fetch, or a "what's new" poll past the last bar) are answered
+        # from the two endpoints without walking the midpoints.
+        if count <= 1 or target_dt <= probe(0):
+            return 0
+        if target_dt > probe(count - 1):
+            return count - 1
+
+        # Bottenbruch-style search: one comparison per step and a fixed
+        # ceil(log2(count)) steps, with the final compare deciding between
+        # ``base`` and its successor.
+        base, n = 0, count
+        while n > 1:
+            half = n // 2
+            if probe(base + half) < target_dt:
+                base += half
+            n -= half
+        return base + (probe(base) < target_dt)
 
     @staticmethod
-    def detect_data_interval(raw_ticks: list[dict]) -> int:
+    def detect_data_interval(raw_ticks) -> int:
         """Detect the base interval of raw quotation data in seconds.
 
         Examines the median time gap between consecutive data points.
@@ -239,20 +571,24 @@ class StockDataFetcher:
           - 300 means 5-minute bars
           - etc.
         """
-        if len(raw_ticks) < 2:
+        if isinstance(raw_ticks, dict):
+            times = raw_ticks["datetime"][:100]
+        else:
+            times = np.array(
+                [t["datetime"] for t in raw_ticks[:100]], dtype="datetime64[us]"
+            )
+        if len(times) < 2:
             return 0
 
-        diffs = []
-        for i in range(1, min(len(raw_ticks), 100)):
-            delta = (raw_ticks[i]["datetime"] - raw_ticks[i - 1]["datetime"]).total_seconds()
-            if delta > 0:
-                diffs.append(delta)
+        deltas = np.diff(times) / np.timedelta64(1, "s")
+        diffs = deltas[deltas > 0]
 
-        if not diffs:
+        if not len(diffs):
             return 0
 
-        diffs.sort()
-        median_gap = diffs[len(diffs) // 2]
+        # Upper median (no averaging of the middle pair), via a partial sort
+        mid = len(diffs) // 2
+        median_gap = float(np.partition(diffs, mid)[mid])
 
         # Classify against known bar intervals (10% tolerance)
         for known in (60, 300, 600, 3600, 86400):
@@ -264,28 +600,96 @@ class StockDataFetcher:
         return int(round(median_gap / 60) * 60)  # round to nearest minute
 
     @staticmethod
-    def _format_bars(raw_ticks: list[dict]) -> list[dict]:
-        """Convert raw tick dicts to the output bar format without aggregation."""
-        return [
-            {
-                "time": int(tick["datetime"].timestamp()),
-                "open": round(tick["open"], 2),
-                "high": round(tick["high"], 2),
-                "low": round(tick["low"], 2),
-                "close": round(tick["close"], 2),
-                "volume": round(tick["volume"], 2),
-            }
-            for tick in raw_ticks
-        ]
+    def _format_bars(raw_ticks) -> list[dict]:
+        """Convert raw ticks to the output bar format without aggregation."""
+        return aos_from_soa(StockDataFetcher._format_columns(raw_ticks))
+
+    @staticmethod
+    def _format_columns(raw_ticks) -> dict:
+        """Columnar counterpart of :meth:`_format_bars`.
+
+        Times use the same convention as aggregated bars: the naive bar
+        timestamp read as UTC (see :func:`_epoch_seconds`).
+        """
+        ticks = _tick_columns(raw_ticks)
+        columns = {"time": ticks["datetime"].astype("datetime64[s]").astype(np.int64)}
+        for f in _BAR_FIELDS[1:]:
+            columns[f] = np.round(ticks[f], 2)
+        return columns
 
     @staticmethod
-    def _aggregate_bars(raw_ticks: list[dict], target_interval: int = 60) -> list[dict]:
+    def _resample_ohlcv(raw_ticks, target_interval: int) -> pd.DataFrame:
+        """Resample raw data into an OHLCV DataFrame indexed by bar start.
+
+        Ticks are bucketed by ``epoch_seconds // target_interval`` and
+        grouped on that key rather than with ``DataFrame.resample``, which
+        materialises every bin across the full time span -- thousands of
+        empty bins per weekend or session gap on intraday data.  Buckets
+        are aligned to the Unix epoch, which matches pandas' midnight
+        anchoring for every interval that divides a day.
+        """
+        ticks = _tick_columns(raw_ticks)
+        # Resample the prices as float32 when they are cent-grid quotes small
+        # enough to round-trip (see _FLOAT32_PRICE_LIMIT) -- half the bytes
+        # through pandas' group reductions.
+        # Volume is summed, so it keeps float64 to avoid accumulating error.
+        price_dtype = np.float64
+        if len(ticks["high"]) and (
+            ticks["high"].max() < _FLOAT32_PRICE_LIMIT
+            and ticks["low"].min() > -_FLOAT32_PRICE_LIMIT
+            and all(_on_cent_grid(ticks[f]) for f in _BAR_FIELDS[1:5])
+        ):
+            price_dtype = np.float32
+        df = pd.DataFrame(
+            {f: ticks[f].astype(price_dtype, copy=False) for f in _BAR_FIELDS[1:5]},
+            index=pd.DatetimeIndex(ticks["datetime"]),
+        )
+        df["volume"] = ticks["volume"]
+        # Quotations are read in index order, so the data is almost always
+        # sorted already -- only pay for the sort when it isn't.
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+
+        seconds = df.index.to_numpy().astype("datetime64[s]").astype(np.int64)
+        buckets = seconds // target_interval
+        values = [df[f].to_numpy() for f in _BAR_FIELDS[1:]]
+
+        if numba is not None and all(np.isfinite(v).all() for v in values):
+            # Compiled single pass; pandas' groupby handles the NaN cases.
+            bucket_ids, *columns = _bucket_ohlcv_kernel(buckets, *values)
+            ohlcv = pd.DataFrame(dict(zip(_BAR_FIELDS[1:], columns)))
+        else:
+            ohlcv = df.groupby(buckets).agg({
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "sum",
+            }).dropna(subset=["open"])
+            bucket_ids = ohlcv.index.to_numpy()
+        ohlcv.index = pd.DatetimeIndex(
+            (bucket_ids * target_interval).astype("datetime64[s]")
+        )
+        return ohlcv
+
+    @staticmethod
+    def _aggregate_columns(raw_ticks, target_interval: int = 60) -> dict:
+        """Columnar counterpart of :meth:`_aggregate_bars`."""
+        ohlcv = StockDataFetcher._resample_ohlcv(raw_ticks, target_interval)
+        columns = {"time": ohlcv.index.as_unit("s").asi8}
+        for f in _BAR_FIELDS[1:]:
+            columns[f] = np.round(ohlcv[f].to_numpy(dtype=np.float64), 2)
+        return columns
+
+    @staticmethod
+    def _aggregate_bars(raw_ticks, target_interval: int = 60) -> list[dict]:
         """Aggregate raw data into OHLCV bars of the specified interval.
 
         Parameters
         ----------
-        raw_ticks : list[dict]
-            Raw data with 'datetime', 'open', 'high', 'low', 'close', 'volume'.
+        raw_ticks : dict or list[dict]
+            Raw tick columns from :meth:`_read_quotations`, or per-tick
+            dicts, with 'datetime', 'open', 'high', 'low', 'close', 'volume'.
         target_interval : int
             Target bar size in seconds (60=1min, 300=5min, 600=10min, 86400=daily).
 
@@ -294,31 +698,7 @@ class StockDataFetcher:
         list[dict]
             Bars with 'time' (epoch seconds), 'open', 'high', 'low', 'close', 'volume'.
         """
-        resample_rule = _INTERVAL_TO_PANDAS.get(target_interval, f"{target_interval}s")
-
-        df = pd.DataFrame(raw_ticks)
-        df.set_index("datetime", inplace=True)
-        df.sort_index(inplace=True)
-
-        ohlcv = df.resample(resample_rule).agg({
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "sum",
-        }).dropna(subset=["open"])
-
-        bars = []
-        for dt, row in ohlcv.iterrows():
-            bars.append({
-                "time": int(dt.timestamp()),
-                "open": round(row["open"], 2),
-                "high": round(row["high"], 2),
-                "low": round(row["low"], 2),
-                "close": round(row["close"], 2),
-                "volume": round(row["volume"], 2),
-            })
-        return bars
+        return aos_from_soa(StockDataFetcher._aggregate_columns(raw_ticks, target_interval))
 
     # Backward-compatible alias
     @staticmethod
@@ -331,129 +711,273 @@ class StockDataFetcher:
         return StockDataFetcher._aggregate_bars(raw_ticks, 60)
 
 
-def _get_latest_bars_once(symbol: str, num_bars: int = 500, interval: int = 60,
-                          days: int | None = None,
-                          end_date: str | None = None) -> dict:
-    """Single-attempt fetch of recent bars (called by :func:`get_latest_bars`).
+# All pooled AmiBroker traffic runs on one long-lived worker thread that
+# owns the single attached fetcher.  COM objects belong to the apartment
+# (thread) that created them, and the dashboard's threaded server starts a
+# fresh thread per request, so a per-thread connection would leak a COM
+# init and a dispatch on every request.  AmiBroker serves OLE calls one at
+# a time anyway, so funnelling them through one thread costs nothing.
+_COM_THREAD = threading.local()
 
-    Returns ``{"data": [...], "error": None, "data_range": {...}}`` on
-    success, or ``{"data": [], "error": "message"}`` on failure.
+
+def _mark_com_thread() -> None:
+    _COM_THREAD.active = True
+
+
+_COM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="amibroker-com", initializer=_mark_com_thread,
+)
+_com_fetcher: StockDataFetcher | None = None
+
+# Error text that means the connection itself is bad (RPC/HRESULT faults),
+# as opposed to a data problem such as an unknown symbol.
+_COM_FAULT_MARKERS = ("-2147", "server threw an exception", "rpc server", "com error")
+
+
+def _on_com_thread(fn, *args, **kwargs):
+    """Call ``fn(*args, **kwargs)`` on the AmiBroker COM thread and return its result.
+
+    Runs inline when already on that thread; exceptions propagate to the
+    caller.
     """
-    fetcher = StockDataFetcher()
-    if not fetcher.connect():
-        return {
-            "data": [],
-            "error": "AmiBroker is not running. Please start AmiBroker.",
-        }
+    if getattr(_COM_THREAD, "active", False):
+        return fn(*args, **kwargs)
+    return _COM_EXECUTOR.submit(fn, *args, **kwargs).result()
 
-    try:
-        fetcher.load_database()
-        stock = fetcher.ab.Stocks(symbol)
-        if stock is None:
-            return {"data": [], "error": f"Symbol '{symbol}' not found in database."}
 
-        quotations = stock.Quotations
-        count = quotations.Count
-        if count == 0:
-            return {"data": [], "error": f"No quotation data for '{symbol}'."}
+def _is_com_fault(error) -> bool:
+    """Return True if *error* (an exception or error string) is a COM/RPC fault."""
+    if isinstance(error, pythoncom.com_error):
+        return True
+    text = str(error).lower()
+    return any(marker in text for marker in _COM_FAULT_MARKERS)
 
-        # First and last dates available in the database
-        first_available_dt = _com_date_to_datetime(quotations(0).Date)
-        last_available_dt = _com_date_to_datetime(quotations(count - 1).Date)
 
-        # Determine the anchor date (end of the data window)
-        if end_date is not None:
-            try:
-                anchor_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
-                    hour=23, minute=59, second=59
-                )
-            except ValueError:
-                return {
-                    "data": [],
-                    "error": f"Invalid end_date format: '{end_date}'. Use YYYY-MM-DD.",
-                }
-            # Find the index at or just before the anchor date
-            end_idx = fetcher._bisect_quotations(quotations, count, anchor_dt)
-            # _bisect returns the first index AT or AFTER target.  If that
-            # bar is past the anchor, step back.
-            if end_idx < count:
-                end_bar_dt = _com_date_to_datetime(quotations(end_idx).Date)
-                if end_bar_dt > anchor_dt:
-                    end_idx = max(0, end_idx - 1)
-            # We want to include end_idx, so the range is [start_idx .. end_idx]
-            end_idx_exclusive = end_idx + 1
-        else:
-            anchor_dt = last_available_dt
-            end_idx_exclusive = count
-
-        # Determine start index
-        if days is not None:
-            cutoff = anchor_dt - timedelta(days=days)
-            start_idx = fetcher._bisect_quotations(
-                quotations, count, cutoff
-            )
-            # Clamp to not go past end_idx_exclusive
-            start_idx = min(start_idx, max(0, end_idx_exclusive - 1))
-            logger.info(
-                "Days filter: anchor=%s, cutoff=%s, start_idx=%d, end_idx=%d of %d",
-                anchor_dt, cutoff, start_idx, end_idx_exclusive, count,
-            )
-        else:
-            start_idx = max(0, end_idx_exclusive - num_bars)
+def _pooled_fetcher() -> StockDataFetcher | None:
+    """Return the shared connected fetcher, attaching on first use.
 
-        raw_ticks = []
-        for i in range(start_idx, end_idx_exclusive):
-            q = quotations(i)
-            bar_dt = _com_date_to_datetime(q.Date)
-            raw_ticks.append({
-                "datetime": bar_dt,
-                "open": float(q.Open),
-                "high": float(q.High),
-                "low": float(q.Low),
-                "close": float(q.Close),
-                "volume": float(q.Volume),
-            })
-
-        logger.info("Read %d raw ticks (%s) for %s.",
-                     len(raw_ticks),
-                     f"last {days} days" if days else f"last {num_bars}",
-                     symbol)
-
-        if not raw_ticks:
+    Must run on the COM thread (see :func:`_on_com_thread`).  Returns None
+    if AmiBroker is not running.
+    """
+    global _com_fetcher
+    if _com_fetcher is None or _com_fetcher.ab is None:
+        fetcher = StockDataFetcher()
+        if not fetcher.connect():
+            fetcher.disconnect()  # balance the CoInitialize
+            return None
+        _com_fetcher = fetcher
+    return _com_fetcher
+
+
+def _drop_com_fetcher() -> None:
+    global _com_fetcher
+    fetcher, _com_fetcher = _com_fetcher, None
+    if fetcher is not None:
+        fetcher.disconnect()
+
+
+def _reset_fetcher_pool() -> None:
+    """Disconnect and forget the shared fetcher.
+
+    Called after a COM fault so the next request re-attaches (AmiBroker
+    may have been restarted underneath a cached connection).
+    """
+    _on_com_thread(_drop_com_fetcher)
+
+
+def _read_latest_ticks(fetcher: StockDataFetcher, symbol: str, num_bars: int = 500,
+                       days: int | None = None,
+                       end_date: str | None = None) -> dict:
+    """Read the raw ticks behind a :func:`get_latest_bars` request.
+
+    This is the COM half of the fetch: *fetcher* must be connected with the
+    database loaded.  Returns ``{"ticks": <tick columns>, "error": None,
+    "data_range": {...}}`` on success, or ``{"data": [], "error": "message"}``
+    when the symbol or window can't be read.  :func:`_bars_from_latest_ticks`
+    turns the success form into the final result.
+    """
+    stock = fetcher.stock(symbol)
+    if stock is None:
+        return {"data": [], "error": f"Symbol '{symbol}' not found in database."}
+
+    quotations = stock.Quotations
+    count = quotations.Count
+    if count == 0:
+        return {"data": [], "error": f"No quotation data for '{symbol}'."}
+
+    # First and last dates available in the database
+    first_available_dt = _com_date_to_datetime(quotations(0).Date)
+    last_available_dt = _com_date_to_datetime(quotations(count - 1).Date)
+    probes = _quotation_probes(symbol, count, last_available_dt)
+    probes.setdefault(0, first_available_dt)
+
+    # Determine the anchor date (end of the data window)
+    if end_date is not None:
+        try:
+            anchor_dt = _end_of_day(end_date)
+        except ValueError:
             return {
                 "data": [],
-                "error": None,
-                "data_range": {
-                    "first_date": None,
-                    "last_date": None,
-                    "first_available_date": first_available_dt.strftime("%Y-%m-%d"),
-                    "last_available_date": last_available_dt.strftime("%Y-%m-%d"),
-                },
+                "error": f"Invalid end_date format: '{end_date}'. Use YYYY-MM-DD.",
             }
+        # Find the index at or just before the anchor date
+        end_idx = fetcher._bisect_quotations(quotations, count, anchor_dt, probes)
+        # _bisect returns the first index AT or AFTER target.  If that
+        # bar is past the anchor, step back.
+        if end_idx < count:
+            end_bar_dt = _com_date_to_datetime(quotations(end_idx).Date)
+            if end_bar_dt > anchor_dt:
+                end_idx = max(0, end_idx - 1)
+        # We want to include end_idx, so the range is [start_idx .. end_idx]
+        end_idx_exclusive = end_idx + 1
+    else:
+        anchor_dt = last_available_dt
+        end_idx_exclusive = count
+
+    # Determine start index
+    if days is not None:
+        cutoff = anchor_dt - timedelta(days=days)
+        start_idx = fetcher._bisect_quotations(
+            quotations, count, cutoff, probes
+        )
+        # Clamp to not go past end_idx_exclusive
+        start_idx = min(start_idx, max(0, end_idx_exclusive - 1))
+        logger.info(
+            "Days filter: anchor=%s, cutoff=%s, start_idx=%d, end_idx=%d of %d",
+            anchor_dt, cutoff, start_idx, end_idx_exclusive, count,
+        )
+    else:
+        start_idx = max(0, end_idx_exclusive - num_bars)
+
+    raw_ticks = fetcher._read_quotations(quotations, start_idx, end_idx_exclusive)
+    tick_times = raw_ticks["datetime"]
+
+    logger.info("Read %d raw ticks (%s) for %s.",
+                 len(tick_times),
+                 f"last {days} days" if days else f"last {num_bars}",
+                 symbol)
+
+    first_date = last_date = None
+    if len(tick_times):
+        first_date = str(np.datetime_as_string(tick_times[0], unit="D"))
+        last_date = str(np.datetime_as_string(tick_times[-1], unit="D"))
+    return {
+        "ticks": raw_ticks,
+        "error": None,
+        "data_range": {
+            "first_date": first_date,
+            "last_date": last_date,
+            "first_available_date": first_available_dt.strftime("%Y-%m-%d"),
+            "last_available_date": last_available_dt.strftime("%Y-%m-%d"),
+        },
+    }
 
+
+def _bars_from_latest_ticks(read: dict, interval: int = 60) -> dict:
+    """Format or aggregate the ticks from :func:`_read_latest_ticks`.
+
+    This is the CPU half of the fetch and touches no COM objects, so it
+    can run on any thread.  Error results are passed through unchanged.
+    """
+    if read.get("error"):
+        return read
+
+    raw_ticks = read["ticks"]
+    bars = []
+    if len(raw_ticks["datetime"]):
         # Detect source interval and aggregate if needed
-        source_interval = fetcher.detect_data_interval(raw_ticks)
+        source_interval = StockDataFetcher.detect_data_interval(raw_ticks)
         if source_interval > 0 and source_interval >= interval:
-            bars = fetcher._format_bars(raw_ticks)
+            bars = StockDataFetcher._format_bars(raw_ticks)
         else:
-            bars = fetcher._aggregate_bars(raw_ticks, interval)
-
+            bars = StockDataFetcher._aggregate_bars(raw_ticks, interval)
         logger.info("Produced %d bars at %ds interval for explorer.", len(bars), interval)
+
+    return {"data": bars, "error": None, "data_range": read["data_range"]}
+
+
+def _read_latest_ticks_pooled(symbol: str, num_bars: int = 500,
+                              days: int | None = None,
+                              end_date: str | None = None) -> dict:
+    """:func:`_read_latest_ticks` over the shared connection (COM thread only).
+
+    Read failures come back as error results; the connection is dropped
+    only when the failure is a COM fault.
+    """
+    fetcher = _pooled_fetcher()
+    if fetcher is None:
         return {
-            "data": bars,
-            "error": None,
-            "data_range": {
-                "first_date": raw_ticks[0]["datetime"].strftime("%Y-%m-%d"),
-                "last_date": raw_ticks[-1]["datetime"].strftime("%Y-%m-%d"),
-                "first_available_date": first_available_dt.strftime("%Y-%m-%d"),
-                "last_available_date": last_available_dt.strftime("%Y-%m-%d"),
-            },
+            "data": [],
+            "error": "AmiBroker is not running. Please start AmiBroker.",
         }
+
+    try:
+        fetcher.load_database()
+        return _read_latest_ticks(fetcher, symbol, num_bars, days, end_date)
     except Exception as exc:
         logger.error("Error fetching latest bars for %s: %s", symbol, exc)
+        if _is_com_fault(exc):
+            _reset_fetcher_pool()
         return {"data": [], "error": str(exc)}
-    finally:
-        fetcher.disconnect()
+
+
+def _get_latest_bars_once(symbol: str, num_bars: int = 500, interval: int = 60,
+                          days: int | None = None,
+                          end_date: str | None = None) -> dict:
+    """Single-attempt fetch of recent bars (called by :func:`get_latest_bars`).
+
+    Returns ``{"data": [...], "error": None, "data_range": {...}}`` on
+    success, or ``{"data": [], "error": "message"}`` on failure.
+    """
+    read = _on_com_thread(_read_latest_ticks_pooled, symbol, num_bars, days, end_date)
+    try:
+        return _bars_from_latest_ticks(read, interval)
+    except Exception as exc:
+        logger.error("Error aggregating latest bars for %s: %s", symbol, exc)
+        return {"data": [], "error": str(exc)}
+
+
+def get_latest_bars_many(symbols: list[str], num_bars: int = 500, interval: int = 60,
+                         days: int | None = None,
+                         end_date: str | None = None,
+                         *,
+                         max_workers: int = 8) -> dict[str, dict]:
+    """Fetch recent bars for several symbols over one AmiBroker connection.
+
+    Quotations for every symbol are read serially on the shared COM
+    thread's connection -- COM objects are apartment-bound, and AmiBroker
+    serves calls one at a time anyway -- then the CPU-bound formatting and
+    aggregation run on a thread pool (pandas and NumPy release the GIL in
+    their reductions).
+    Arguments other than *symbols* and *max_workers* are as for
+    :func:`get_latest_bars`.  Unlike that function there is no retry on
+    transient COM faults; a failed symbol gets an error result and the
+    others are unaffected.
+
+    Returns ``{symbol: result}`` with one :func:`get_latest_bars`-shaped
+    result per distinct symbol, in input order.
+    """
+    unique = list(dict.fromkeys(symbols))
+    if not unique:
+        return {}
+
+    def _read_all() -> dict:
+        return {
+            symbol: _read_latest_ticks_pooled(symbol, num_bars, days, end_date)
+            for symbol in unique
+        }
+
+    reads = _on_com_thread(_read_all)
+
+    def _finish(symbol: str) -> dict:
+        try:
+            return _bars_from_latest_ticks(reads[symbol], interval)
+        except Exception as exc:
+            logger.error("Error aggregating latest bars for %s: %s", symbol, exc)
+            return {"data": [], "error": str(exc)}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as ex:
+        return dict(zip(unique, ex.map(_finish, unique)))
 
 
 import time as _time
@@ -495,8 +1019,28 @@ def get_latest_bars(symbol: str, num_bars: int = 500, interval: int = 60,
     success.  ``data_range`` contains ``first_date``, ``last_date``, and
     ``last_available_date`` (the very last date in the database).
     """
-    last_result = None
+    result = _get_latest_bars_once(
+        symbol=symbol, num_bars=num_bars, interval=interval,
+        days=days, end_date=end_date,
+    )
+    if not result.get("error"):
+        return result
+
     for attempt in range(1, _max_retries + 1):
+        err = str(result["error"])
+
+        # Retry only on transient COM server faults
+        if "-2147417851" not in err and "server threw an exception" not in err.lower():
+            # Non-transient error — return immediately
+            return result
+        if attempt == _max_retries:
+            break
+
+        logger.warning(
+            "COM server fault for %s (attempt %d/%d), retrying in %ds...",
+            symbol, attempt, _max_retries, attempt,
+        )
+        _time.sleep(attempt)  # back off: 1s, 2s, ...
         result = _get_latest_bars_once(
             symbol=symbol, num_bars=num_bars, interval=interval,
             days=days, end_date=end_date,
@@ -504,23 +1048,8 @@ def get_latest_bars(symbol: str, num_bars: int = 500, interval: int = 60,
         if not result.get("error"):
             return result
 
-        last_result = result
-        err = result["error"]
-
-        # Retry only on transient COM server faults
-        if "-2147417851" in str(err) or "server threw an exception" in str(err).lower():
-            logger.warning(
-                "COM server fault for %s (attempt %d/%d), retrying in %ds...",
-                symbol, attempt, _max_retries, attempt,
-            )
-            _time.sleep(attempt)  # back off: 1s, 2s, 3s
-            continue
-
-        # Non-transient error — return immediately
-        return result
-
     logger.error("All %d attempts failed for %s.", _max_retries, symbol)
-    return last_result
+    return result
 
 
 # ======================================================================
@@ -557,7 +1086,7 @@ def get_dataset_date_range(symbol: str = None, refresh: bool = False) -> dict:
     if not refresh and _DATE_RANGE_CACHE_PATH.exists():
         try:
             cache = json.loads(_DATE_RANGE_CACHE_PATH.read_text(encoding="utf-8"))
-            cache_age = (datetime.now() - datetime.fromisoformat(cache["fetched_at"])).total_seconds()
+            cache_age = _time.time() - _fetched_epoch(cache)
             if cache_age < _DATE_RANGE_CACHE_TTL and cache.get("symbol") == symbol:
                 return {
                     "first_date": cache["first_date"],
@@ -569,8 +1098,8 @@ def get_dataset_date_range(symbol: str = None, refresh: bool = False) -> dict:
             pass
 
     # Query AmiBroker via COM
-    fetcher = StockDataFetcher()
-    if not fetcher.connect():
+    result = _on_com_thread(_read_date_range_pooled, symbol)
+    if result is None:
         # Fall back to stale cache
         if _DATE_RANGE_CACHE_PATH.exists():
             try:
@@ -584,10 +1113,40 @@ def get_dataset_date_range(symbol: str = None, refresh: bool = False) -> dict:
             except Exception:
                 pass
         return {"first_date": None, "last_date": None, "error": "AmiBroker not running", "stale": True}
+    if result["error"]:
+        return result
+
+    try:
+        # Write cache
+        _DATE_RANGE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DATE_RANGE_CACHE_PATH.write_text(json.dumps({
+            "symbol": symbol,
+            "first_date": result["first_date"],
+            "last_date": result["last_date"],
+            "fetched_at": datetime.now().isoformat(),
+            "fetched_at_epoch": int(_time.time()),
+        }), encoding="utf-8")
+    except Exception as exc:
+        logger.error("get_dataset_date_range failed: %s", exc)
+        return {"first_date": None, "last_date": None, "error": str(exc), "stale": True}
+
+    return result
+
+
+def _read_date_range_pooled(symbol: str) -> dict | None:
+    """Read *symbol*'s first and last quotation dates (COM thread only).
+
+    Returns None if AmiBroker is not running, otherwise a
+    :func:`get_dataset_date_range`-shaped result.  The shared connection
+    is dropped only on COM faults.
+    """
+    fetcher = _pooled_fetcher()
+    if fetcher is None:
+        return None
 
     try:
         fetcher.load_database()
-        stock = fetcher.ab.Stocks(symbol)
+        stock = fetcher.stock(symbol)
         if stock is None:
             return {"first_date": None, "last_date": None, "error": f"Symbol '{symbol}' not found", "stale": True}
 
@@ -598,32 +1157,523 @@ def get_dataset_date_range(symbol: str = None, refresh: bool = False) -> dict:
 
         first_dt = _com_date_to_datetime(quotations(0).Date)
         last_dt = _com_date_to_datetime(quotations(count - 1).Date)
-
-        first_date = first_dt.strftime("%Y-%m-%d")
-        last_date = last_dt.strftime("%Y-%m-%d")
-
-        # Write cache
-        _DATE_RANGE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        _DATE_RANGE_CACHE_PATH.write_text(json.dumps({
-            "symbol": symbol,
-            "first_date": first_date,
-            "last_date": last_date,
-            "fetched_at": datetime.now().isoformat(),
-        }), encoding="utf-8")
-
-        return {"first_date": first_date, "last_date": last_date, "error": None, "stale": False}
+        return {
+            "first_date": first_dt.strftime("%Y-%m-%d"),
+            "last_date": last_dt.strftime("%Y-%m-%d"),
+            "error": None,
+            "stale": False,
+        }
 
     except Exception as exc:
         logger.error("get_dataset_date_range failed: %s", exc)
+        if _is_com_fault(exc):
+            _reset_fetcher_pool()
         return {"first_date": None, "last_date": None, "error": str(exc), "stale": True}
-    finally:
-        fetcher.disconnect()
 
 
 # ======================================================================
 # Cached wrapper
 # ======================================================================
 
+_ZSTD_LEVEL = 3
+_GZIP_LEVEL = 1
+_MAX_SHARD_READERS = 8
+
+# Chart settings read on every render, resolved once at import.
+_BARS_BEFORE = CHART_SETTINGS["bars_before_entry"]
+_BARS_AFTER = CHART_SETTINGS["bars_after_exit"]
+_CACHE_MAX_AGE_S = CHART_SETTINGS["cache_max_age_hours"] * 3600
+
+# One lock per symbol so concurrent requests don't interleave the
+# read-fetch-write cycle on the same shard files.
+_CACHE_LOCKS: dict[str, threading.Lock] = {}
+
+
+def _cache_lock(symbol: str) -> threading.Lock:
+    lock = _CACHE_LOCKS.get(symbol)
+    if lock is None:
+        lock = _CACHE_LOCKS.setdefault(symbol, threading.Lock())
+    return lock
+
+
+def _month_start(dt: datetime) -> datetime:
+    return datetime(dt.year, dt.month, 1)
+
+
+def _next_month(dt: datetime) -> datetime:
+    return datetime(dt.year + dt.month // 12, dt.month % 12 + 1, 1)
+
+
+def _months_between(start: datetime, end: datetime) -> list[datetime]:
+    """First-of-month datetimes for every month touched by ``[start, end]``."""
+    months = []
+    month = _month_start(start)
+    while month <= end:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def _month_window(month: datetime, start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    """Clip ``[start, end]`` to the calendar month beginning at *month*."""
+    return (
+        max(start, month),
+        min(end, _next_month(month) - timedelta(microseconds=1)),
+    )
+
+
+def _shard_path(symbol: str, month: datetime) -> Path:
+    """Return the chart cache shard for *symbol* and calendar *month*.
+
+    Shards live at ``CACHE_DIR/<symbol>/<YYYY-MM>.json.zst`` when the
+    optional ``zstandard`` package is installed, and ``.json.gz`` otherwise.
+    """
+    suffix = ".json.zst" if zstandard is not None else ".json.gz"
+    return CACHE_DIR / symbol / f"{month:%Y-%m}{suffix}"
+
+
+def _meta_path(symbol: str) -> Path:
+    """Return the shard-index sidecar for *symbol* (``CACHE_DIR/<symbol>/meta.json``).
+
+    The sidecar maps ``YYYY-MM`` to that shard's ``fetched_at`` (ISO and
+    ``fetched_at_epoch``), ``window_start``, ``window_end`` and ``n_bars``,
+    so coverage and freshness can be checked without reading the bar
+    payloads.
+    """
+    return CACHE_DIR / symbol / "meta.json"
+
+
+def _read_cache_file(path: Path) -> dict:
+    """Load a cache file written by :func:`_write_cache_file`."""
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        try:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        except zstandard.ZstdError as exc:
+            raise ValueError(f"corrupt zstd frame: {exc}") from exc
+    elif path.suffix == ".gz":
+        try:
+            data = gzip.decompress(data)
+        except (OSError, EOFError) as exc:
+            raise ValueError(f"corrupt gzip stream: {exc}") from exc
+    if orjson is not None:
+        return orjson.loads(data)  # raises a json.JSONDecodeError subclass
+    return json.loads(data)
+
+
+def _write_cache_file(path: Path, payload: dict) -> None:
+    """Serialize *payload* as compact JSON, compressed for ``.zst``/``.gz`` paths.
+
+    Uses ``orjson`` when installed (several times faster than the stdlib
+    encoder on the float-heavy bar columns).  Note that ``orjson`` writes
+    NaN as ``null``; the bar decoder reads that back as NaN.
+    """
+    if orjson is not None:
+        data = orjson.dumps(payload)
+    else:
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    if path.suffix == ".zst":
+        data = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    elif path.suffix == ".gz":
+        data = gzip.compress(data, compresslevel=_GZIP_LEVEL)
+    path.write_bytes(data)
+
+
+def _encode_bar_columns(columns: dict) -> dict:
+    """Encode columnar bars for the cache file.
+
+    ``time`` is delta-encoded: a run on a regular grid is stored as just
+    ``base_time``, ``step`` and ``n`` (``time = base_time + arange(n) * step``);
+    a run with gaps (market closes, missing minutes) additionally stores the
+    ``n - 1`` consecutive differences in ``time_deltas``.
+    """
+    times = np.asarray(columns["time"], dtype=np.int64)
+    n = len(times)
+    deltas = np.diff(times)
+    step = int(deltas[0]) if n > 1 else 60
+    has_gaps = bool((deltas != step).any())
+
+    encoded = {
+        "n": n,
+        "base_time": int(times[0]) if n else 0,
+        "step": step,
+        "has_gaps": has_gaps,
+    }
+    if has_gaps:
+        encoded["time_deltas"] = deltas.tolist()
+    for f in _BAR_FIELDS[1:]:
+        encoded[f] = np.asarray(columns[f], dtype=np.float64).tolist()
+    return encoded
+
+
+def _decode_bar_columns(encoded: dict) -> dict:
+    """Inverse of :func:`_encode_bar_columns`."""
+    n = encoded["n"]
+    if n == 0:
+        return _empty_columns()
+    if encoded["has_gaps"]:
+        offsets = np.zeros(n, dtype=np.int64)
+        np.cumsum(np.asarray(encoded["time_deltas"], dtype=np.int64), out=offsets[1:])
+    else:
+        offsets = np.arange(n, dtype=np.int64) * encoded["step"]
+
+    columns = {"time": encoded["base_time"] + offsets}
+    for f in _BAR_FIELDS[1:]:
+        columns[f] = np.asarray(encoded[f], dtype=np.float64)
+        if len(columns[f]) != n:
+            raise ValueError(f"cache column '{f}' has {len(columns[f])} values, expected {n}")
+    return columns
+
+
+def _read_shard(path: Path) -> dict | None:
+    """Load one shard, or return None if it does not exist."""
+    if not path.exists():
+        return None
+    return _read_cache_file(path)
+
+
+def _read_meta(symbol: str) -> dict:
+    """Return the per-month entries of *symbol*'s sidecar ({} if unusable)."""
+    try:
+        meta = _read_shard(_meta_path(symbol))
+    except (json.JSONDecodeError, ValueError) as exc:
+        logger.warning("Cache index corrupt for %s, reading shards: %s", symbol, exc)
+        return {}
+    if not isinstance(meta, dict) or not isinstance(meta.get("months"), dict):
+        return {}
+    return meta["months"]
+
+
+def _fetched_epoch(entry: dict) -> float:
+    """Epoch seconds at which a cache *entry* was fetched.
+
+    Reads ``fetched_at_epoch``; entries written before it existed only
+    carry the ISO ``fetched_at`` string.
+    """
+    try:
+        return entry["fetched_at_epoch"]
+    except KeyError:
+        return datetime.fromisoformat(entry["fetched_at"]).timestamp()
+
+
+def _shard_fresh(shard: dict, now: float | None = None) -> bool:
+    """True if *shard* was fetched within ``cache_max_age_hours``.
+
+    *now* is epoch seconds (``time.time()``), defaulting to the current time.
+    """
+    return (now or _time.time()) - _fetched_epoch(shard) < _CACHE_MAX_AGE_S
+
+
+def _shard_covers(shard: dict, month: datetime, start: datetime, end: datetime) -> bool:
+    """True if *shard* is fresh and covers *month*'s part of ``[start, end]``."""
+    want_start, want_end = _month_window(month, start, end)
+    return (
+        _shard_fresh(shard)
+        and datetime.fromisoformat(shard["window_start"]) <= want_start
+        and datetime.fromisoformat(shard["window_end"]) >= want_end
+    )
+
+
+def _bar_floor(dt: datetime) -> datetime:
+    """Start of the cached (1-minute) bar whose span contains *dt*."""
+    return dt.replace(second=0, microsecond=0)
+
+
+def _slice_columns(columns: dict, start: datetime, end: datetime) -> dict:
+    """Return the bars of *columns* whose time lies in ``[start, end]``.
+
+    Bars are stored in time order, so the window is located by binary
+    search and returned as views rather than by masking every bar.
+    """
+    times = columns["time"]
+    lo = np.searchsorted(times, _epoch_seconds(start), side="left")
+    hi = np.searchsorted(times, _epoch_seconds(end), side="right")
+    return {f: col[lo:hi] for f, col in columns.items()}
+
+
+def _concat_columns(parts: list[dict]) -> dict:
+    if not parts:
+        return _empty_columns()
+    return {f: np.concatenate([p[f] for p in parts]) for f in _BAR_FIELDS}
+
+
+def _merge_bar_columns(parts: list[dict]) -> dict:
+    """Concatenate chronologically ordered bar *parts*, combining equal times.
+
+    Parts fetched for adjacent windows can each hold a partial bar for the
+    minute where the windows meet; those are folded into one bar (first
+    open, max high, min low, last close, summed volume).
+    """
+    merged = _concat_columns(parts)
+    times = merged["time"]
+    if len(times) < 2:
+        return merged
+    if (np.diff(times) < 0).any():
+        order = np.argsort(times, kind="stable")
+        merged = {f: col[order] for f, col in merged.items()}
+        times = merged["time"]
+
+    starts = np.flatnonzero(np.r_[True, times[1:] != times[:-1]])
+    if len(starts) == len(times):
+        return merged
+    ends = np.r_[starts[1:], len(times)] - 1
+    return {
+        "time": times[starts],
+        "open": merged["open"][starts],
+        "high": np.maximum.reduceat(merged["high"], starts),
+        "low": np.minimum.reduceat(merged["low"], starts),
+        "close": merged["close"][ends],
+        "volume": np.add.reduceat(merged["volume"], starts),
+    }
+
+
+def _padded_window(
+    start_dt: datetime,
+    end_dt: datetime,
+    padding_before: int | None,
+    padding_after: int | None,
+) -> tuple[datetime, datetime]:
+    """Widen ``[start_dt, end_dt]`` by the chart padding (in minutes)."""
+    if padding_before is None:
+        padding_before = _BARS_BEFORE
+    if padding_after is None:
+        padding_after = _BARS_AFTER
+    return (
+        start_dt - timedelta(minutes=padding_before),
+        end_dt + timedelta(minutes=padding_after),
+    )
+
+
+def _read_shard_or_none(path: Path) -> dict | None:
+    """:func:`_read_shard`, treating a corrupt shard as missing."""
+    try:
+        return _read_shard(path)
+    except (json.JSONDecodeError, KeyError, ValueError) as exc:
+        logger.warning("Cache shard corrupt (%s), re-fetching: %s", path, exc)
+        return None
+
+
+def _cached_window_parts(
+    symbol: str, start: datetime, end: datetime,
+) -> tuple[list[tuple[datetime, dict]], list[tuple[datetime, datetime]]]:
+    """Split ``[start, end]`` into cached bars and the spans still missing.
+
+    Returns ``(parts, gaps)``.  *parts* holds ``(window_start, columns)``
+    for the cached bars of every fresh shard overlapping the request, and
+    *gaps* the ``(start, end)`` spans no fresh shard covers, in time order
+    with spans that meet across a month boundary joined.  A shard whose
+    window covers only part of its month still contributes its bars, so
+    when the live tail grows only the new bars need fetching.  Shards are
+    read concurrently (file I/O and decompression release the GIL).
+    """
+    months = _months_between(start, end)
+    meta = _read_meta(symbol)
+    now = _time.time()
+
+    def _worth_reading(month: datetime) -> bool:
+        # Months the sidecar marks as stale or not overlapping are gaps
+        # without opening their shard; months it doesn't know about (or
+        # can't parse) fall back to reading the shard itself.
+        entry = meta.get(f"{month:%Y-%m}")
+        if entry is None:
+            return True
+        want_start, want_end = _month_window(month, start, end)
+        try:
+            return (
+                _shard_fresh(entry, now)
+                and datetime.fromisoformat(entry["window_start"]) <= want_end
+                and datetime.fromisoformat(entry["window_end"]) >= want_start
+            )
+        except (KeyError, TypeError, ValueError):
+            return True
+
+    to_read = [m for m in months if _worth_reading(m)]
+    paths = [_shard_path(symbol, m) for m in to_read]
+    if len(paths) <= 1:
+        loaded = [_read_shard_or_none(p) for p in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(paths), _MAX_SHARD_READERS)) as ex:
+            loaded = list(ex.map(_read_shard_or_none, paths))
+    shards = dict(zip(to_read, loaded))
+
+    parts, gaps = [], []
+    for month in months:
+        want_start, want_end = _month_window(month, start, end)
+        have_start = have_end = None
+        shard = shards.get(month)
+        if month not in shards:
+            logger.info("Cache stale for %s (%s) per index.", symbol, f"{month:%Y-%m}")
+        elif shard is None:
+            logger.info("Cache miss for %s: no shard for %s.", symbol, f"{month:%Y-%m}")
+        else:
+            try:
+                if _shard_fresh(shard, now):
+                    have_start = max(datetime.fromisoformat(shard["window_start"]), want_start)
+                    have_end = min(datetime.fromisoformat(shard["window_end"]), want_end)
+                    if have_start <= have_end:
+                        # Floor the start: the bar holding have_start is
+                        # labelled at its minute, and its other half (if
+                        # any) arrives from the adjoining gap to be folded.
+                        parts.append((have_start, _slice_columns(
+                            _decode_bar_columns(shard["bars"]),
+                            _bar_floor(have_start), have_end,
+                        )))
+                    else:
+                        have_start = have_end = None
+            except (KeyError, ValueError) as exc:
+                logger.warning("Cache shard corrupt for %s (%s), re-fetching: %s",
+                               symbol, f"{month:%Y-%m}", exc)
+                have_start = have_end = None
+
+        if have_start is None:
+            gaps.append((want_start, want_end))
+            continue
+        if want_start < have_start:
+            gaps.append((want_start, have_start - _ONE_US))
+        if have_end < want_end:
+            gaps.append((have_end + _ONE_US, want_end))
+
+    merged_gaps = []
+    for gap_start, gap_end in gaps:
+        if merged_gaps and gap_start - merged_gaps[-1][1] <= _ONE_US:
+            merged_gaps[-1] = (merged_gaps[-1][0], gap_end)
+        else:
+            merged_gaps.append((gap_start, gap_end))
+    return parts, merged_gaps
+
+
+def _load_cached_window(symbol: str, start: datetime, end: datetime) -> dict | None:
+    """Return cached 1-minute bars for ``[start, end]``, or None on a miss.
+
+    Every month the window touches must have a fresh shard whose recorded
+    window covers that month's part of the request.
+    """
+    parts, gaps = _cached_window_parts(symbol, start, end)
+    if gaps:
+        return None
+    logger.info("Cache hit for %s (%d shard(s)).", symbol, len(parts))
+    return _concat_columns([columns for _, columns in parts])
+
+
+def _store_cached_window(symbol: str, columns: dict, start: datetime, end: datetime) -> None:
+    """Write freshly fetched bars for ``[start, end]`` into monthly shards.
+
+    Only the months the window touches are rewritten.  When a fresh shard
+    already covers an overlapping or exactly adjacent window, its bars
+    outside the new window are kept and the recorded window becomes the
+    union; a shard whose window is separated from the new one by any gap
+    is replaced outright.
+
+    Window bounds are tick times and usually fall mid-minute, while bars
+    are labelled at the start of their minute.  The bar straddling a
+    bound is therefore kept from both sides and folded, so a minute
+    split between two fetches is stored whole.
+    """
+    now = int(_time.time())
+    index = {}
+
+    for month in _months_between(start, end):
+        win_start, win_end = _month_window(month, start, end)
+        new_cols = _slice_columns(columns, _bar_floor(win_start), win_end)
+        path = _shard_path(symbol, month)
+
+        try:
+            old = _read_shard(path)
+        except (json.JSONDecodeError, KeyError, ValueError):
+            old = None
+        if old is not None:
+            old_start = datetime.fromisoformat(old["window_start"])
+            old_end = datetime.fromisoformat(old["window_end"])
+            # Only overlapping or exactly adjacent windows merge: anything
+            # between two windows a tick apart was never fetched, so
+            # recording their union would serve that span as a cache hit.
+            touching = (
+                old_start <= win_end + _ONE_US
+                and old_end + _ONE_US >= win_start
+            )
+            if _shard_fresh(old, now) and touching:
+                old_cols = _decode_bar_columns(old["bars"])
+                old_times = old_cols["time"]
+                # Replace only old bars whose whole minute lies inside the
+                # new window; partial minutes at either edge are folded.
+                first_inner = _epoch_seconds(_bar_floor(win_start))
+                if _bar_floor(win_start) != win_start:
+                    first_inner += 60
+                inner = (old_times >= first_inner) & (
+                    old_times + 60 <= _epoch_seconds(win_end + _ONE_US)
+                )
+                old_cols = {f: c[~inner] for f, c in old_cols.items()}
+                parts = [old_cols, new_cols] if old_start <= win_start else [new_cols, old_cols]
+                new_cols = _merge_bar_columns(parts)
+                win_start, win_end = min(old_start, win_start), max(old_end, win_end)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "fetched_at": datetime.fromtimestamp(now).isoformat(),
+            "fetched_at_epoch": now,
+            "window_start": win_start.isoformat(),
+            "window_end": win_end.isoformat(),
+            "n_bars": len(new_cols["time"]),
+        }
+        _write_cache_file(path, {
+            "symbol": symbol,
+            "month": f"{month:%Y-%m}",
+            "fetched_at": entry["fetched_at"],
+            "fetched_at_epoch": now,
+            "window_start": entry["window_start"],
+            "window_end": entry["window_end"],
+            "bars": _encode_bar_columns(new_cols),
+        })
+        index[f"{month:%Y-%m}"] = entry
+
+    # The sidecar is written after the shards it describes, so a crash in
+    # between leaves it pessimistic (a re-read), never pointing at data
+    # that isn't there.
+    if index:
+        months = _read_meta(symbol)
+        months.update(index)
+        _write_cache_file(_meta_path(symbol), {"symbol": symbol, "months": months})
+
+    logger.info("Cache written for %s (%d bars).", symbol, len(columns["time"]))
+
+
+def _fetch_cache_gaps(symbol: str, gaps: list[tuple[datetime, datetime]]) -> dict:
+    """Fetch 1-minute columns for each uncovered span (COM thread only).
+
+    Returns ``{"data": [(gap_start, gap_end, columns), ...], "error": None}``,
+    or the first failing :meth:`StockDataFetcher.fetch_ohlcv` result.  The
+    shared connection is dropped only on COM faults, not on data errors
+    such as an unknown symbol.
+    """
+    fetcher = _pooled_fetcher()
+    if fetcher is None:
+        return {
+            "data": [],
+            "error": (
+                "AmiBroker is not running. "
+                "Please start AmiBroker to view trade charts."
+            ),
+        }
+
+    fetched = []
+    try:
+        fetcher.load_database()
+        for gap_start, gap_end in gaps:
+            result = fetcher.fetch_ohlcv(
+                symbol, gap_start, gap_end, interval=60, layout="soa",
+            )
+            if result["error"]:
+                if _is_com_fault(result["error"]):
+                    _reset_fetcher_pool()
+                return result
+            fetched.append((gap_start, gap_end, result["data"]))
+    except Exception as exc:
+        if _is_com_fault(exc):
+            _reset_fetcher_pool()
+        raise
+    return {"data": fetched, "error": None}
+
+
 def get_ohlcv_cached(
     symbol: str,
     start_dt: datetime,
@@ -631,111 +1681,142 @@ def get_ohlcv_cached(
     padding_before: int = None,
     padding_after: int = None,
     interval: int = 60,
+    layout: str = "aos",
 ) -> dict:
-    """Fetch OHLCV bars at the requested *interval*, using a JSON file cache.
+    """Fetch OHLCV bars at the requested *interval*, using a file cache.
 
     *padding_before* / *padding_after* widen the requested window by that
     many minutes so the chart shows context around the trade.
 
-    The cache always stores 1-minute bars.  Higher timeframes are
-    re-aggregated from the cached data on the fly.
+    The cache is sharded by calendar month (see :func:`_shard_path`), so a
+    request only reads and rewrites the months it touches, and only the
+    spans no fresh shard covers are fetched from AmiBroker.  It always
+    stores 1-minute bars; higher timeframes are re-aggregated from the
+    cached data on the fly.
+
+    *layout* selects the shape of ``data`` exactly as in
+    :meth:`StockDataFetcher.fetch_ohlcv`.
 
     Returns ``{"data": [...], "error": None}`` on success or
     ``{"data": [], "error": "message"}`` on failure.
     """
-    if padding_before is None:
-        padding_before = CHART_SETTINGS["bars_before_entry"]
-    if padding_after is None:
-        padding_after = CHART_SETTINGS["bars_after_exit"]
+    if layout not in _LAYOUTS:
+        raise ValueError(f"layout must be one of {_LAYOUTS}, got {layout!r}")
 
-    padded_start = start_dt - timedelta(minutes=padding_before)
-    padded_end = end_dt + timedelta(minutes=padding_after)
+    padded_start, padded_end = _padded_window(
+        start_dt, end_dt, padding_before, padding_after,
+    )
 
     # --- Check cache (always stored as 1-min bars) ---
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    cache_file = CACHE_DIR / f"{symbol}.json"
+    with _cache_lock(symbol):
+        parts, gaps = _cached_window_parts(symbol, padded_start, padded_end)
 
-    cached_bars = None
-    if cache_file.exists():
-        try:
-            cache = json.loads(cache_file.read_text(encoding="utf-8"))
-            cache_age_hours = (
-                datetime.now() - datetime.fromisoformat(cache["fetched_at"])
-            ).total_seconds() / 3600
-            max_age = CHART_SETTINGS["cache_max_age_hours"]
-
-            if cache_age_hours < max_age:
-                cached_start = datetime.fromisoformat(cache["window_start"])
-                cached_end = datetime.fromisoformat(cache["window_end"])
-
-                if cached_start <= padded_start and cached_end >= padded_end:
-                    logger.info("Cache hit for %s (age %.1fh).", symbol, cache_age_hours)
-                    ps_ts = int(padded_start.timestamp())
-                    pe_ts = int(padded_end.timestamp())
-                    cached_bars = [
-                        b for b in cache["bars"]
-                        if ps_ts <= b["time"] <= pe_ts
-                    ]
-
-            if cached_bars is None:
-                logger.info("Cache stale or incomplete for %s, re-fetching.", symbol)
-        except (json.JSONDecodeError, KeyError, ValueError) as exc:
-            logger.warning("Cache file corrupt for %s, re-fetching: %s", symbol, exc)
-
-    if cached_bars is None:
-        # --- Fetch from AmiBroker (always at 1-min / native resolution) ---
-        fetcher = StockDataFetcher()
-        if not fetcher.connect():
-            return {
-                "data": [],
-                "error": (
-                    "AmiBroker is not running. "
-                    "Please start AmiBroker to view trade charts."
-                ),
-            }
+        if not gaps:
+            logger.info("Cache hit for %s (%d shard(s)).", symbol, len(parts))
+        else:
+            # --- Fetch the uncovered spans (always at 1-min / native resolution) ---
+            logger.info("Fetching %d uncovered span(s) for %s.", len(gaps), symbol)
+            result = _on_com_thread(_fetch_cache_gaps, symbol, gaps)
+            if result["error"]:
+                return result
+
+            for gap_start, gap_end, columns in result["data"]:
+                parts.append((gap_start, columns))
+                # --- Write cache (1-min bars) ---
+                try:
+                    _store_cached_window(symbol, columns, gap_start, gap_end)
+                except Exception as exc:
+                    logger.warning("Failed to write cache for %s: %s", symbol, exc)
+
+        parts.sort(key=lambda part: part[0])
+        cached = _merge_bar_columns([columns for _, columns in parts])
 
-        try:
-            fetcher.load_database()
-            result = fetcher.fetch_ohlcv(symbol, padded_start, padded_end, interval=60)
-        finally:
-            fetcher.disconnect()
+    # --- Re-aggregate to the requested interval if needed ---
+    if interval > 60 and len(cached["time"]):
+        # The epoch columns become tick columns directly -- no per-bar
+        # datetime objects on the way into the resample.
+        ticks = {"datetime": cached["time"].astype("datetime64[s]")}
+        for f in _BAR_FIELDS[1:]:
+            ticks[f] = cached[f]
+        cached = StockDataFetcher._aggregate_columns(ticks, interval)
 
-        if result["error"]:
-            return result
+    if layout == "soa":
+        return {"data": cached, "error": None}
+    return {"data": aos_from_soa(cached), "error": None}
+
+
+def iter_ohlcv_cached(
+    symbol: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    padding_before: int = None,
+    padding_after: int = None,
+):
+    """Yield cached 1-minute bars for the padded window one dict at a time.
+
+    Shards are decoded lazily in month order, so a consumer that only needs
+    the head of a wide window (e.g. via ``itertools.islice``) never touches
+    the later months.  From the first month that is missing or stale, the
+    rest of the window is filled through :func:`get_ohlcv_cached`.
 
-        cached_bars = result["data"]
+    Raises ``RuntimeError`` with the fetch error message if AmiBroker has
+    to be queried and the fetch fails.
+    """
+    padded_start, padded_end = _padded_window(
+        start_dt, end_dt, padding_before, padding_after,
+    )
 
-        # --- Write cache (1-min bars) ---
+    for month in _months_between(padded_start, padded_end):
+        want_start, want_end = _month_window(month, padded_start, padded_end)
         try:
-            cache_payload = {
-                "symbol": symbol,
-                "fetched_at": datetime.now().isoformat(),
-                "window_start": padded_start.isoformat(),
-                "window_end": padded_end.isoformat(),
-                "bars": cached_bars,
-            }
-            cache_file.write_text(
-                json.dumps(cache_payload, indent=2), encoding="utf-8"
+            shard = _read_shard(_shard_path(symbol, month))
+            columns = (
+                _decode_bar_columns(shard["bars"])
+                if shard is not None and _shard_covers(shard, month, padded_start, padded_end)
+                else None
             )
-            logger.info("Cache written for %s (%d bars).", symbol, len(cached_bars))
-        except Exception as exc:
-            logger.warning("Failed to write cache for %s: %s", symbol, exc)
+        except (json.JSONDecodeError, KeyError, ValueError):
+            columns = None
 
-    # --- Re-aggregate to the requested interval if needed ---
-    if interval > 60 and cached_bars:
-        reformat = [
-            {
-                "datetime": datetime.fromtimestamp(b["time"]),
-                "open": b["open"],
-                "high": b["high"],
-                "low": b["low"],
-                "close": b["close"],
-                "volume": b["volume"],
-            }
-            for b in cached_bars
-        ]
-        final_bars = StockDataFetcher._aggregate_bars(reformat, interval)
-    else:
-        final_bars = cached_bars
+        if columns is None:
+            result = get_ohlcv_cached(
+                symbol, want_start, padded_end,
+                padding_before=0, padding_after=0, layout="soa",
+            )
+            if result["error"]:
+                raise RuntimeError(result["error"])
+            yield from _iter_bars(result["data"])
+            return
+
+        yield from _iter_bars(_slice_columns(columns, _bar_floor(want_start), want_end))
+
+
+def get_ohlcv_cached_many(
+    symbols: list[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    *,
+    max_workers: int = 8,
+    **kwargs,
+) -> dict[str, dict]:
+    """Run :func:`get_ohlcv_cached` for several symbols concurrently.
+
+    Cache-hit shard reads and re-aggregation overlap across symbols; cache
+    misses are fetched over the one shared AmiBroker connection on the COM
+    thread (see :func:`_on_com_thread`), so workers open no connections of
+    their own and leave no COM state behind.  Remaining keyword arguments
+    (*padding_before*, *interval*, *layout*, ...) are passed through
+    unchanged.
+
+    Returns ``{symbol: result}`` with one ``get_ohlcv_cached`` result per
+    distinct symbol, in input order.
+    """
+    unique = list(dict.fromkeys(symbols))
+    if not unique:
+        return {}
+
+    def _fetch(symbol: str) -> dict:
+        return get_ohlcv_cached(symbol, start_dt, end_dt, **kwargs)
 
-    return {"data": final_bars, "error": None}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as ex:
+        return dict(zip(unique, ex.map(_fetch, unique)))
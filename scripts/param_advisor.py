@@ -6,18 +6,40 @@ optimization ranges, priorities, and configurations based on
 the parameter type (period, threshold, multiplier, etc.).
 """
 
+import copy
+import functools
 import logging
 import math
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from scripts.strategy_db import get_strategy, get_latest_version
+from scripts.strategy_db import get_strategy, get_latest_version, get_latest_version_id
 from scripts.afl_parser import parse_afl_params
 
 logger = logging.getLogger(__name__)
 
+# Grids larger than this are reported as overflow rather than estimated --
+# at ~2.5 s per combination they could never be run.
+_MAX_COMBINATIONS = 10**12
+# A single parameter with more steps than this almost certainly has a
+# step size out of proportion to its range.
+_SUSPICIOUS_STEPS = 10_000
+
+# Analyses keyed by (strategy_id, version_id).  Versions are immutable, so
+# an entry only goes stale when strategy-level fields (e.g. the name)
+# change -- the TTL bounds how long such an edit can go unseen.  Storing a
+# strategy's analysis evicts its other versions, so the cache holds at
+# most one entry per strategy.
+_ANALYSIS_CACHE: dict[tuple[str, str], tuple[float, dict]] = {}
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+_ANALYSIS_CACHE_TTL = 300  # seconds
+
 
 # ---------------------------------------------------------------------------
 # Parameter classification rules
@@ -91,42 +113,66 @@ _PARAM_RULES = [
 ]
 
 
+# Keyword -> index of its rule in _PARAM_RULES.  _KW_RE finds every
+# keyword occurrence in one scan: the lookahead matches at each position
+# without consuming, so overlapping hits (e.g. "atr" and "length" in
+# "atr_length") are all seen and the earliest-defined rule still wins.
+# Longest-first alternation keeps "multiplier" ahead of its "mult" prefix.
+_KW_TO_RULE = {
+    kw: i for i, rule in enumerate(_PARAM_RULES) for kw in rule["keywords"]
+}
+_KW_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_KW_TO_RULE, key=len, reverse=True))) + "))"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_rule(name: str) -> dict | None:
+    """Return the first rule in ``_PARAM_RULES`` with a keyword in *name*.
+
+    Matching is case-insensitive.  Memoized on the raw name, so a repeat
+    lookup skips lowercasing as well as the scan: the same parameter names
+    recur across strategies, while the range/step merging in
+    :func:`_classify_param` depends on each param's bounds and stays
+    uncached.
+    """
+    hits = [_KW_TO_RULE[m.group(1)] for m in _KW_RE.finditer(name.lower())]
+    return _PARAM_RULES[min(hits)] if hits else None
+
+
 def _classify_param(param: dict) -> dict:
     """Classify a parameter and generate optimization suggestion."""
-    name_lower = param["name"].lower()
-
-    # Try to match against rules
-    for rule in _PARAM_RULES:
-        if any(kw in name_lower for kw in rule["keywords"]):
-            # Use the rule's defaults, but respect the param's existing range
-            current_min = param["min"]
-            current_max = param["max"]
-            current_step = param["step"]
-
-            suggested_min = max(rule["default_range"][0], current_min)
-            suggested_max = min(rule["default_range"][1], current_max)
-
-            # If the suggested range is too narrow, widen it
-            if suggested_max <= suggested_min:
-                suggested_min = rule["default_range"][0]
-                suggested_max = rule["default_range"][1]
-
-            # Suggest a coarser step for optimization (fewer combinations)
-            suggested_step = rule["default_step"]
-            if suggested_step < current_step:
-                suggested_step = current_step
-
-            return {
-                "param_name": param["name"],
-                "current_default": param["default"],
-                "current_range": [current_min, current_max],
-                "current_step": current_step,
-                "suggested_range": [suggested_min, suggested_max],
-                "suggested_step": suggested_step,
-                "rationale": rule["rationale"],
-                "priority": rule["priority"],
-                "category": rule["category"],
-            }
+    rule = _match_rule(param["name"])
+    if rule is not None:
+        # Use the rule's defaults, but respect the param's existing range
+        current_min = param["min"]
+        current_max = param["max"]
+        current_step = param["step"]
+
+        suggested_min = max(rule["default_range"][0], current_min)
+        suggested_max = min(rule["default_range"][1], current_max)
+
+        # If the suggested range is too narrow, widen it
+        if suggested_max <= suggested_min:
+            suggested_min = rule["default_range"][0]
+            suggested_max = rule["default_range"][1]
+
+        # Suggest a coarser step for optimization (fewer combinations)
+        suggested_step = rule["default_step"]
+        if suggested_step < current_step:
+            suggested_step = current_step
+
+        return {
+            "param_name": param["name"],
+            "current_default": param["default"],
+            "current_range": [current_min, current_max],
+            "current_step": current_step,
+            "suggested_range": [suggested_min, suggested_max],
+            "suggested_step": suggested_step,
+            "rationale": rule["rationale"],
+            "priority": rule["priority"],
+            "category": rule["category"],
+        }
 
     # Default classification for unrecognized params
     return {
@@ -155,13 +201,29 @@ def _estimate_combinations(suggestions: list, optimize_all: bool = False) -> dic
             "params_to_optimize": [],
             "total_combinations": 0,
             "estimated_time_seconds": 0,
+            "overflow": False,
         }
 
-    total_combos = 1
+    steps = []
     for p in params_to_opt:
         range_size = p["suggested_range"][1] - p["suggested_range"][0]
-        steps = max(1, int(range_size / p["suggested_step"]) + 1)
-        total_combos *= steps
+        n = max(1, int(range_size / p["suggested_step"]) + 1)
+        if n > _SUSPICIOUS_STEPS:
+            logger.warning(
+                "Param %s has %d optimization steps; check its step size.",
+                p["param_name"], n,
+            )
+        steps.append(n)
+
+    # Compare in log space so a runaway grid never becomes a huge bigint.
+    if sum(map(math.log, steps)) > math.log(_MAX_COMBINATIONS):
+        return {
+            "params_to_optimize": [p["param_name"] for p in params_to_opt],
+            "total_combinations": None,
+            "estimated_time_seconds": None,
+            "overflow": True,
+        }
+    total_combos = math.prod(steps)
 
     # Rough estimate: ~2.5 seconds per combination for AmiBroker optimization
     est_seconds = total_combos * 2.5
@@ -170,6 +232,7 @@ def _estimate_combinations(suggestions: list, optimize_all: bool = False) -> dic
         "params_to_optimize": [p["param_name"] for p in params_to_opt],
         "total_combinations": total_combos,
         "estimated_time_seconds": round(est_seconds),
+        "overflow": False,
     }
 
 
@@ -186,6 +249,16 @@ def analyze_strategy_params(strategy_id: str) -> dict:
     dict
         Analysis results including parameter suggestions and optimization config.
     """
+    # The latest-version id lookup is the cheap part; when it hasn't moved
+    # the previous analysis is returned without loading the AFL.  Callers
+    # get deep copies so they can't edit the cached params/suggestions.
+    version_id = get_latest_version_id(strategy_id)
+    if version_id is not None:
+        with _ANALYSIS_CACHE_LOCK:
+            cached = _ANALYSIS_CACHE.get((strategy_id, version_id))
+        if cached is not None and time.monotonic() - cached[0] < _ANALYSIS_CACHE_TTL:
+            return copy.deepcopy(cached[1])
+
     strategy = get_strategy(strategy_id)
     if strategy is None:
         return {"error": f"Strategy not found: {strategy_id}"}
@@ -194,6 +267,24 @@ def analyze_strategy_params(strategy_id: str) -> dict:
     if version is None:
         return {"error": f"No versions found for strategy: {strategy_id}"}
 
+    analysis = _analyze_version(strategy_id, strategy, version)
+    if "error" not in analysis:
+        with _ANALYSIS_CACHE_LOCK:
+            for key in [k for k in _ANALYSIS_CACHE if k[0] == strategy_id]:
+                del _ANALYSIS_CACHE[key]
+            _ANALYSIS_CACHE[(strategy_id, version["id"])] = (time.monotonic(), analysis)
+        return copy.deepcopy(analysis)
+    return analysis
+
+
+def clear_analysis_cache() -> None:
+    """Drop all cached :func:`analyze_strategy_params` results."""
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE.clear()
+
+
+def _analyze_version(strategy_id: str, strategy: dict, version: dict) -> dict:
+    """Build the :func:`analyze_strategy_params` result for one version."""
     afl_content = version.get("afl_content", "")
     if not afl_content:
         return {"error": "No AFL content in latest version"}
@@ -205,11 +296,7 @@ def analyze_strategy_params(strategy_id: str) -> dict:
             "strategy_name": strategy["name"],
             "params": [],
             "suggestions": [],
-            "optimization_config": {
-                "params_to_optimize": [],
-                "total_combinations": 0,
-                "estimated_time_seconds": 0,
-            },
+            "optimization_config": _estimate_combinations([]),
         }
 
     suggestions = [_classify_param(p) for p in params]
@@ -231,18 +318,21 @@ def analyze_strategy_params(strategy_id: str) -> dict:
     }
 
 
-def get_all_strategy_analysis() -> list[dict]:
+def get_all_strategy_analysis(*, max_workers: int = 8) -> list[dict]:
     """Analyze parameters for ALL strategies in the database.
 
-    Returns a list of analysis dicts, one per strategy.
-    Strategies with no parameters are included with empty suggestions.
+    Returns a list of analysis dicts, one per strategy, in
+    :func:`list_strategies` order.  Strategies with no parameters are
+    included with empty suggestions.  Strategies are analyzed on up to
+    *max_workers* threads to overlap their database reads; each query
+    opens its own SQLite connection, so the threads share none.
     """
     from scripts.strategy_db import list_strategies
 
-    results = []
-    for strategy in list_strategies():
-        analysis = analyze_strategy_params(strategy["id"])
-        if "error" not in analysis:
-            results.append(analysis)
+    ids = [strategy["id"] for strategy in list_strategies()]
+    if not ids:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids)))) as ex:
+        analyses = list(ex.map(analyze_strategy_params, ids))
 
-    return results
+    return [a for a in analyses if "error" not in a]
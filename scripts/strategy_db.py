@@ -553,6 +553,19 @@ def get_latest_version(strategy_id: str, db_path: Path = None) -> dict | None:
         conn.close()
 
 
+def get_latest_version_id(strategy_id: str, db_path: Path = None) -> str | None:
+    """Return only the id of a strategy's latest version (no AFL text)."""
+    conn = _get_connection(db_path)
+    try:
+        row = conn.execute(
+            "SELECT id FROM strategy_versions WHERE strategy_id = ? ORDER BY version_number DESC LIMIT 1",
+            (strategy_id,),
+        ).fetchone()
+        return row["id"] if row is not None else None
+    finally:
+        conn.close()
+
+
 # ---------------------------------------------------------------------------
 # Run CRUD
 # ---------------------------------------------------------------------------
@@ -1347,7 +1360,7 @@ def delete_param_tooltip(name: str, db_path: Path = None) -> bool:
 
 
 def seed_param_tooltips(db_path: Path = None) -> int:
-    """Seed param_tooltips table from the hardcoded PARAM_INFO dictionary.
+    """Seed param_tooltips table from the hardcoded PARAM_INFO records.
 
     Only inserts rows that don't already exist (preserves user edits).
     Returns the number of rows inserted.
@@ -1368,11 +1381,11 @@ def seed_param_tooltips(db_path: Path = None) -> int:
                        VALUES (?, ?, ?, ?, ?, ?)""",
                     (
                         name,
-                        info.get("indicator", ""),
-                        info.get("math", ""),
-                        info.get("param", ""),
-                        info.get("typical", ""),
-                        info.get("guidance", ""),
+                        info.indicator,
+                        info.math,
+                        info.param,
+                        info.typical,
+                        info.guidance,
                     ),
                 )
                 inserted += 1
@@ -0,0 +1,52 @@
+"""Tests for scripts.ole_bar_analyzer -- bar/signal time conversions."""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.ole_bar_analyzer import _parse_signal_csv, _unix_to_datenum_timenum
+from scripts.ole_stock_data import StockDataFetcher
+
+
+@pytest.fixture
+def non_utc_tz(monkeypatch):
+    """Run under a host timezone well away from UTC."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is unavailable on this platform")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestBarTimeConvention:
+    BAR_DT = datetime(2026, 2, 10, 20, 42, 0)
+
+    def _bar_time(self):
+        tick = {"datetime": self.BAR_DT, "open": 1.0, "high": 1.0,
+                "low": 1.0, "close": 1.0, "volume": 1.0}
+        return StockDataFetcher._format_bars([tick])[0]["time"]
+
+    def test_bar_time_decodes_to_wall_clock(self, non_utc_tz):
+        assert _unix_to_datenum_timenum(self._bar_time()) == (1260210, 204200)
+
+    def test_signal_times_match_bar_times(self, non_utc_tz, tmp_path):
+        csv_path = tmp_path / "signals.csv"
+        csv_path.write_text(
+            "Symbol,Date/Time,Buy,Short,DN,TN\n"
+            "GCZ5,02/10/2026 20:42:00,1,0,1260210,204200\n"
+            "GCZ5,02/11/2026,0,1,1260211,0\n",
+            encoding="utf-8",
+        )
+        signals = _parse_signal_csv(str(csv_path))
+        assert signals["error"] is None
+        assert signals["buy"] == [{"time": self._bar_time()}]
+        assert signals["short"][0]["time"] - self._bar_time() == 3 * 3600 + 18 * 60
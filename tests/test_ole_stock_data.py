@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import numpy as np
 import pytest
 
 # Ensure the project root is importable
@@ -18,6 +19,17 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_module_state():
+    """Don't let pooled connections or bisection probes leak between tests."""
+    from scripts import ole_stock_data
+    ole_stock_data._reset_fetcher_pool()
+    ole_stock_data._reset_probe_cache()
+    yield
+    ole_stock_data._reset_fetcher_pool()
+    ole_stock_data._reset_probe_cache()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -68,6 +80,15 @@ class TestComDateConversion:
         assert dt.day == 1
         assert dt.hour == 0
 
+    def test_end_of_day(self):
+        from scripts.ole_stock_data import _end_of_day
+
+        assert _end_of_day("2025-07-21") == datetime(2025, 7, 21, 23, 59, 59)
+        assert _end_of_day("2025-7-1") == datetime(2025, 7, 1, 23, 59, 59)
+        for bad in ("2025-02-30", "2025/07/21", "21-07-2025", ""):
+            with pytest.raises(ValueError):
+                _end_of_day(bad)
+
     def test_fractional_date(self):
         from scripts.ole_stock_data import _com_date_to_datetime
 
@@ -113,6 +134,35 @@ class TestStockDataFetcher:
         assert result is False
         assert fetcher.ab is None
 
+    @patch("win32com.client.gencache.EnsureDispatch")
+    @patch("win32com.client.Dispatch")
+    def test_connect_upgrades_late_bound_dispatch(self, mock_dispatch, mock_ensure):
+        import win32com.client
+        from scripts.ole_stock_data import StockDataFetcher
+
+        late_bound = MagicMock(spec=win32com.client.CDispatch)
+        mock_dispatch.return_value = late_bound
+        mock_ensure.return_value = early_bound = MagicMock()
+
+        fetcher = StockDataFetcher()
+        assert fetcher.connect() is True
+        mock_ensure.assert_called_once_with(late_bound)
+        assert fetcher.ab is early_bound
+
+    @patch("win32com.client.gencache.EnsureDispatch")
+    @patch("win32com.client.Dispatch")
+    def test_connect_keeps_late_bound_when_typelib_missing(self, mock_dispatch, mock_ensure):
+        import win32com.client
+        from scripts.ole_stock_data import StockDataFetcher
+
+        late_bound = MagicMock(spec=win32com.client.CDispatch)
+        mock_dispatch.return_value = late_bound
+        mock_ensure.side_effect = Exception("no type library")
+
+        fetcher = StockDataFetcher()
+        assert fetcher.connect() is True
+        assert fetcher.ab is late_bound
+
     def test_disconnect_clears_reference(self):
         from scripts.ole_stock_data import StockDataFetcher
 
@@ -224,8 +274,10 @@ class TestOhlcvCache:
             mock_instance = MockFetcher.return_value
             mock_instance.connect.return_value = True
             mock_instance.fetch_ohlcv.return_value = {
-                "data": [{"time": 1753056890, "open": 3427.0, "high": 3428.0,
-                           "low": 3426.0, "close": 3427.5, "volume": 100}],
+                "data": mod._soa_from_aos(
+                    [{"time": 1753059600, "open": 3427.0, "high": 3428.0,
+                      "low": 3426.0, "close": 3427.5, "volume": 100}]
+                ),
                 "error": None,
             }
 
@@ -238,8 +290,9 @@ class TestOhlcvCache:
             assert len(result["data"]) == 1
             mock_instance.connect.assert_called_once()
 
-            # Verify cache file was written
-            cache_file = tmp_path / "GCZ5.json"
+            # Verify the July 2025 shard was written
+            cache_file = mod._shard_path("GCZ5", datetime(2025, 7, 1))
+            assert cache_file.parent == tmp_path / "GCZ5"
             assert cache_file.exists()
         finally:
             mod.CACHE_DIR = original_cache
@@ -258,22 +311,20 @@ class TestOhlcvCache:
             end = datetime(2025, 7, 21, 2, 0, 0)
 
             # Pre-populate cache
-            cache_data = {
-                "symbol": "GCZ5",
-                "fetched_at": datetime.now().isoformat(),
-                "window_start": (start - timedelta(minutes=60)).isoformat(),
-                "window_end": (end + timedelta(minutes=60)).isoformat(),
-                "bars": [
-                    {"time": 1753056890, "open": 3427.0, "high": 3428.0,
+            mod._store_cached_window(
+                "GCZ5",
+                mod._soa_from_aos([
+                    {"time": 1753059600, "open": 3427.0, "high": 3428.0,
                      "low": 3426.0, "close": 3427.5, "volume": 100},
-                ],
-            }
-            cache_file = tmp_path / "GCZ5.json"
-            cache_file.write_text(json.dumps(cache_data), encoding="utf-8")
+                ]),
+                start - timedelta(minutes=60),
+                end + timedelta(minutes=60),
+            )
 
             result = get_ohlcv_cached("GCZ5", start, end, padding_before=5, padding_after=5)
 
             assert result["error"] is None
+            assert [b["time"] for b in result["data"]] == [1753059600]
             # COM should NOT have been called
             MockFetcher.return_value.connect.assert_not_called()
         finally:
@@ -303,11 +354,640 @@ class TestOhlcvCache:
         finally:
             mod.CACHE_DIR = original_cache
 
+    @patch("scripts.ole_stock_data.StockDataFetcher")
+    def test_window_spanning_months_reads_both_shards(self, MockFetcher, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            start = datetime(2025, 7, 31, 23, 0, 0)
+            end = datetime(2025, 8, 1, 1, 0, 0)
+            times = [mod._epoch_seconds(start + timedelta(minutes=i)) for i in range(121)]
+            mod._store_cached_window(
+                "GCZ5",
+                mod._soa_from_aos([
+                    {"time": t, "open": 1.0, "high": 1.0, "low": 1.0,
+                     "close": 1.0, "volume": 1.0}
+                    for t in times
+                ]),
+                start, end,
+            )
+            assert mod._shard_path("GCZ5", datetime(2025, 7, 1)).exists()
+            assert mod._shard_path("GCZ5", datetime(2025, 8, 1)).exists()
+
+            result = mod.get_ohlcv_cached("GCZ5", start, end, padding_before=0, padding_after=0)
+            assert [b["time"] for b in result["data"]] == times
+            MockFetcher.return_value.connect.assert_not_called()
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    def test_adjacent_windows_merge_into_one_shard(self, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            def bars(start, n):
+                return mod._soa_from_aos([
+                    {"time": mod._epoch_seconds(start + timedelta(minutes=i)),
+                     "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}
+                    for i in range(n)
+                ])
+
+            first = datetime(2025, 7, 21, 1, 0, 0)
+            second = first + timedelta(minutes=30)
+            mod._store_cached_window("GCZ5", bars(first, 30), first,
+                                     second - timedelta(microseconds=1))
+            mod._store_cached_window("GCZ5", bars(second, 30), second, second + timedelta(minutes=29))
+
+            merged = mod._load_cached_window("GCZ5", first, second + timedelta(minutes=29))
+            assert merged is not None
+            assert len(merged["time"]) == 60
+            assert (np.diff(merged["time"]) == 60).all()
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    @patch("scripts.ole_stock_data.StockDataFetcher")
+    def test_partial_shard_fetches_only_uncovered_tail(self, MockFetcher, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            def bars(start, n, volume):
+                return mod._soa_from_aos([
+                    {"time": mod._epoch_seconds(start + timedelta(minutes=i)),
+                     "open": 1.0 + i, "high": 2.0 + i, "low": 0.5 + i,
+                     "close": 1.5 + i, "volume": volume}
+                    for i in range(n)
+                ])
+
+            start = datetime(2025, 7, 21, 1, 0, 0)
+            cached_end = datetime(2025, 7, 21, 1, 29, 30)
+            end = datetime(2025, 7, 21, 1, 59, 0)
+            mod._store_cached_window("GCZ5", bars(start, 30, 1.0), start, cached_end)
+
+            # The tail fetch re-reads the 01:29 minute's remaining ticks.
+            mock_instance = MockFetcher.return_value
+            mock_instance.connect.return_value = True
+            mock_instance.fetch_ohlcv.return_value = {
+                "data": bars(start + timedelta(minutes=29), 31, 2.0), "error": None,
+            }
+
+            result = mod.get_ohlcv_cached(
+                "GCZ5", start, end, padding_before=0, padding_after=0, layout="soa",
+            )
+
+            gap_start = mock_instance.fetch_ohlcv.call_args.args[1]
+            assert gap_start == cached_end + timedelta(microseconds=1)
+            data = result["data"]
+            assert len(data["time"]) == 60
+            assert (np.diff(data["time"]) == 60).all()
+            # The 01:29 bar from both sides is folded into one.
+            assert data["volume"][29] == 3.0
+
+            shard = mod._read_shard(mod._shard_path("GCZ5", datetime(2025, 7, 1)))
+            assert shard["window_start"] == start.isoformat()
+            assert shard["window_end"] == end.isoformat()
+
+            # A second call is a pure cache hit and still sees both halves.
+            mock_instance.fetch_ohlcv.reset_mock()
+            again = mod.get_ohlcv_cached(
+                "GCZ5", start, end, padding_before=0, padding_after=0, layout="soa",
+            )["data"]
+            mock_instance.fetch_ohlcv.assert_not_called()
+            assert len(again["time"]) == 60
+            assert again["volume"][29] == 3.0
+            assert (again["open"][29], again["high"][29]) == (30.0, 31.0)
+            assert (again["low"][29], again["close"][29]) == (0.5, 1.5)
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    def test_separated_windows_are_not_merged(self, tmp_path):
+        """A sub-minute gap between windows must not be recorded as covered."""
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            def bars(start, n):
+                return mod._soa_from_aos([
+                    {"time": mod._epoch_seconds(start + timedelta(minutes=i)),
+                     "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}
+                    for i in range(n)
+                ])
+
+            first = datetime(2025, 7, 21, 10, 0, 0)
+            second = datetime(2025, 7, 21, 10, 30, 0)
+            mod._store_cached_window("GCZ5", bars(first, 30), first,
+                                     datetime(2025, 7, 21, 10, 29, 30))
+            mod._store_cached_window("GCZ5", bars(second, 31), second,
+                                     datetime(2025, 7, 21, 11, 0, 0))
+
+            shard = mod._read_shard(mod._shard_path("GCZ5", datetime(2025, 7, 1)))
+            assert shard["window_start"] == second.isoformat()
+
+            _, gaps = mod._cached_window_parts(
+                "GCZ5", first, datetime(2025, 7, 21, 11, 0, 0),
+            )
+            assert gaps == [(first, second - timedelta(microseconds=1))]
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    def test_shard_fresh_reads_legacy_iso_timestamp(self):
+        """Shards written before fetched_at_epoch still age correctly."""
+        import time
+        from scripts.ole_stock_data import _shard_fresh
+
+        now = time.time()
+        assert _shard_fresh({"fetched_at_epoch": int(now) - 60}, now)
+        assert not _shard_fresh({"fetched_at_epoch": 946684800}, now)
+        assert _shard_fresh({"fetched_at": datetime.now().isoformat()})
+        assert not _shard_fresh({"fetched_at": "2000-01-01T00:00:00"})
+
+    def test_stale_index_entry_skips_shard_read(self, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            start = datetime(2025, 7, 21, 1, 0, 0)
+            end = start + timedelta(minutes=9)
+            mod._store_cached_window("GCZ5", mod._soa_from_aos([
+                {"time": mod._epoch_seconds(start), "open": 1.0, "high": 1.0,
+                 "low": 1.0, "close": 1.0, "volume": 1.0},
+            ]), start, end)
+
+            meta = mod._read_cache_file(mod._meta_path("GCZ5"))
+            assert meta["months"]["2025-07"]["n_bars"] == 1
+
+            with patch.object(mod, "_read_shard", wraps=mod._read_shard) as spy:
+                parts, gaps = mod._cached_window_parts("GCZ5", start, end)
+            assert gaps == [] and len(parts) == 1
+            assert spy.call_count == 2  # sidecar + shard
+
+            meta["months"]["2025-07"]["fetched_at_epoch"] = 946684800  # 2000-01-01
+            mod._write_cache_file(mod._meta_path("GCZ5"), meta)
+            with patch.object(mod, "_read_shard", wraps=mod._read_shard) as spy:
+                parts, gaps = mod._cached_window_parts("GCZ5", start, end)
+            assert parts == [] and gaps == [(start, end)]
+            assert spy.call_count == 1  # sidecar only
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    @patch("scripts.ole_stock_data.StockDataFetcher.connect")
+    def test_cache_hit_reaggregates_to_interval(self, mock_connect, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            start = datetime(2025, 7, 21, 1, 0, 0)
+            end = start + timedelta(minutes=9)
+            mod._store_cached_window("GCZ5", mod._soa_from_aos([
+                {"time": mod._epoch_seconds(start + timedelta(minutes=i)),
+                 "open": 100.0 + i, "high": 101.0 + i, "low": 99.0 + i,
+                 "close": 100.5 + i, "volume": 10.0}
+                for i in range(10)
+            ]), start, end)
+
+            result = mod.get_ohlcv_cached(
+                "GCZ5", start, end, padding_before=0, padding_after=0, interval=300,
+            )
+            assert result["data"] == [
+                {"time": mod._epoch_seconds(start), "open": 100.0, "high": 105.0,
+                 "low": 99.0, "close": 104.5, "volume": 50.0},
+                {"time": mod._epoch_seconds(start) + 300, "open": 105.0, "high": 110.0,
+                 "low": 104.0, "close": 109.5, "volume": 50.0},
+            ]
+            mock_connect.assert_not_called()
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    def test_slice_columns_is_inclusive(self):
+        import scripts.ole_stock_data as mod
+
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        columns = mod._soa_from_aos([
+            {"time": mod._epoch_seconds(base + timedelta(minutes=i)), "open": float(i),
+             "high": float(i), "low": float(i), "close": float(i), "volume": 1.0}
+            for i in range(10)
+        ])
+        sliced = mod._slice_columns(
+            columns, base + timedelta(minutes=2), base + timedelta(minutes=5),
+        )
+        assert sliced["open"].tolist() == [2.0, 3.0, 4.0, 5.0]
+        sliced = mod._slice_columns(
+            columns, base + timedelta(seconds=90), base + timedelta(minutes=2, seconds=30),
+        )
+        assert sliced["open"].tolist() == [2.0]
+
+    def test_merge_bar_columns_folds_shared_minute(self):
+        import scripts.ole_stock_data as mod
+
+        first = mod._soa_from_aos([
+            {"time": 60, "open": 1.0, "high": 3.0, "low": 1.0, "close": 2.0, "volume": 1.0},
+        ])
+        second = mod._soa_from_aos([
+            {"time": 60, "open": 2.0, "high": 4.0, "low": 0.5, "close": 3.5, "volume": 2.0},
+            {"time": 120, "open": 3.5, "high": 3.5, "low": 3.5, "close": 3.5, "volume": 1.0},
+        ])
+        merged = mod.aos_from_soa(mod._merge_bar_columns([first, second]))
+        assert merged == [
+            {"time": 60, "open": 1.0, "high": 4.0, "low": 0.5, "close": 3.5, "volume": 3.0},
+            {"time": 120, "open": 3.5, "high": 3.5, "low": 3.5, "close": 3.5, "volume": 1.0},
+        ]
+
+    @patch("scripts.ole_stock_data.get_ohlcv_cached")
+    def test_cached_many_fans_out_per_symbol(self, mock_cached):
+        from scripts.ole_stock_data import get_ohlcv_cached_many
+
+        mock_cached.side_effect = lambda symbol, *a, **kw: {"data": [symbol], "error": None}
+        start = datetime(2025, 7, 21, 1, 0, 0)
+        end = datetime(2025, 7, 21, 2, 0, 0)
+
+        results = get_ohlcv_cached_many(["GCZ5", "NQZ5", "GCZ5"], start, end, interval=300)
+
+        assert list(results) == ["GCZ5", "NQZ5"]
+        assert results["NQZ5"]["data"] == ["NQZ5"]
+        assert mock_cached.call_count == 2
+        assert all(c.kwargs == {"interval": 300} for c in mock_cached.call_args_list)
+
+    @patch("scripts.ole_stock_data.StockDataFetcher")
+    def test_cached_many_shares_one_connection(self, MockFetcher, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            mock_instance = MockFetcher.return_value
+            mock_instance.connect.return_value = True
+            mock_instance.fetch_ohlcv.return_value = {
+                "data": mod._soa_from_aos(
+                    [{"time": 1753059600, "open": 3427.0, "high": 3428.0,
+                      "low": 3426.0, "close": 3427.5, "volume": 100}]
+                ),
+                "error": None,
+            }
+            start = datetime(2025, 7, 21, 1, 0, 0)
+            end = datetime(2025, 7, 21, 2, 0, 0)
+
+            results = mod.get_ohlcv_cached_many(
+                ["GCZ5", "NQZ5", "ESZ5", "CLZ5"], start, end, max_workers=4,
+            )
+
+            assert all(r["error"] is None for r in results.values())
+            assert mock_instance.fetch_ohlcv.call_count == 4
+            mock_instance.connect.assert_called_once()
+            mock_instance.disconnect.assert_not_called()
+
+            mod._reset_fetcher_pool()
+            mock_instance.disconnect.assert_called_once()
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    def test_iter_cached_is_lazy_per_shard(self, tmp_path):
+        import itertools
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            start = datetime(2025, 7, 31, 23, 0, 0)
+            end = datetime(2025, 8, 1, 1, 0, 0)
+            times = [mod._epoch_seconds(start + timedelta(minutes=i)) for i in range(121)]
+            mod._store_cached_window(
+                "GCZ5",
+                mod._soa_from_aos([
+                    {"time": t, "open": 1.0, "high": 1.0, "low": 1.0,
+                     "close": 1.0, "volume": 1.0}
+                    for t in times
+                ]),
+                start, end,
+            )
+
+            bars = list(mod.iter_ohlcv_cached("GCZ5", start, end, padding_before=0, padding_after=0))
+            assert [b["time"] for b in bars] == times
+
+            with patch.object(mod, "_read_shard", wraps=mod._read_shard) as reads:
+                head = list(itertools.islice(
+                    mod.iter_ohlcv_cached("GCZ5", start, end, padding_before=0, padding_after=0), 5,
+                ))
+            assert [b["time"] for b in head] == times[:5]
+            assert reads.call_count == 1
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    @patch("scripts.ole_stock_data.get_ohlcv_cached")
+    def test_iter_cached_miss_raises_fetch_error(self, mock_cached, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        original_cache = mod.CACHE_DIR
+        mod.CACHE_DIR = tmp_path
+        try:
+            mock_cached.return_value = {"data": [], "error": "AmiBroker is not running."}
+            with pytest.raises(RuntimeError, match="not running"):
+                list(mod.iter_ohlcv_cached("GCZ5", datetime(2025, 7, 21), datetime(2025, 7, 22)))
+        finally:
+            mod.CACHE_DIR = original_cache
+
+    def test_bar_columns_round_trip_regular_grid(self):
+        import scripts.ole_stock_data as mod
+
+        columns = {f: np.arange(5, dtype=np.float64) + 100 for f in mod._BAR_FIELDS}
+        columns["time"] = 1753059600 + np.arange(5, dtype=np.int64) * 60
+        encoded = mod._encode_bar_columns(columns)
+        assert encoded["has_gaps"] is False
+        assert "time_deltas" not in encoded
+        decoded = mod._decode_bar_columns(encoded)
+        for f in mod._BAR_FIELDS:
+            assert decoded[f].tolist() == columns[f].tolist()
+
+    def test_bar_columns_round_trip_with_gaps(self):
+        import scripts.ole_stock_data as mod
+
+        columns = {f: np.arange(4, dtype=np.float64) for f in mod._BAR_FIELDS}
+        columns["time"] = np.array([0, 60, 120, 86400], dtype=np.int64)
+        encoded = mod._encode_bar_columns(columns)
+        assert encoded["has_gaps"] is True
+        assert mod._decode_bar_columns(encoded)["time"].tolist() == [0, 60, 120, 86400]
+
+    def test_cache_file_round_trip(self, tmp_path):
+        import scripts.ole_stock_data as mod
+
+        payload = {"symbol": "GCZ5", "bars": [{"time": 1, "open": 1.5}]}
+        path = tmp_path / "GCZ5.json"
+        mod._write_cache_file(path, payload)
+        assert mod._read_cache_file(path) == payload
+
+    def test_gzip_cache_file_round_trip(self, tmp_path):
+        from scripts import ole_stock_data as mod
+
+        payload = {"symbol": "GCZ5", "bars": {"n": 1, "open": [3427.25]}}
+        path = tmp_path / "GCZ5.json.gz"
+        mod._write_cache_file(path, payload)
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert mod._read_cache_file(path) == payload
+
+        path.write_bytes(b"\x1f\x8bnot gzip")
+        with pytest.raises(ValueError):
+            mod._read_cache_file(path)
+
+    def test_zstd_cache_file_round_trip(self, tmp_path):
+        pytest.importorskip("zstandard")
+        import scripts.ole_stock_data as mod
+
+        payload = {"symbol": "GCZ5", "bars": [{"time": 1, "open": 1.5}] * 100}
+        path = tmp_path / "GCZ5.json.zst"
+        mod._write_cache_file(path, payload)
+        assert path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"  # zstd magic
+        assert mod._read_cache_file(path) == payload
+
 
 # ---------------------------------------------------------------------------
 # Interval detection tests (Sprint 4)
 # ---------------------------------------------------------------------------
 
+class TestLatestBars:
+    """Tests for get_latest_bars and its multi-symbol variant."""
+
+    def _app(self):
+        base = datetime(2025, 7, 21, 9, 0, 0)
+        stocks = {
+            sym: _make_mock_stock(sym, [
+                _make_mock_quotation(base + timedelta(minutes=i),
+                                     p + i, p + i + 1, p + i - 1, p + i + 0.5, 10)
+                for i in range(12)
+            ])
+            for sym, p in (("GCZ5", 3400.0), ("NQZ5", 21000.0))
+        }
+        app = MagicMock()
+        app.Stocks.side_effect = stocks.get
+        return app
+
+    @patch("win32com.client.Dispatch")
+    def test_many_matches_single_symbol_fetches(self, mock_dispatch):
+        from scripts.ole_stock_data import get_latest_bars, get_latest_bars_many
+
+        mock_dispatch.return_value = self._app()
+        results = get_latest_bars_many(["GCZ5", "NQZ5", "ESZ5", "GCZ5"], interval=300)
+
+        assert list(results) == ["GCZ5", "NQZ5", "ESZ5"]
+        assert results["ESZ5"]["error"] == "Symbol 'ESZ5' not found in database."
+        assert mock_dispatch.call_count == 1
+        for sym in ("GCZ5", "NQZ5"):
+            assert results[sym] == get_latest_bars(sym, interval=300)
+            assert len(results[sym]["data"]) == 3
+
+    @patch("scripts.ole_stock_data._time.sleep")
+    @patch("scripts.ole_stock_data._get_latest_bars_once")
+    def test_retries_transient_com_fault(self, mock_once, mock_sleep):
+        from scripts.ole_stock_data import get_latest_bars
+
+        fault = {"data": [], "error": "(-2147417851, 'The server threw an exception.')"}
+        ok = {"data": [1], "error": None}
+
+        mock_once.side_effect = [fault, ok]
+        assert get_latest_bars("GCZ5") is ok
+        mock_sleep.assert_called_once_with(1)
+
+        mock_once.reset_mock(side_effect=True)
+        mock_sleep.reset_mock()
+        mock_once.return_value = fault
+        assert get_latest_bars("GCZ5", _max_retries=3) is fault
+        assert mock_once.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+
+    @patch("scripts.ole_stock_data._time.sleep")
+    @patch("scripts.ole_stock_data._get_latest_bars_once")
+    def test_non_transient_error_not_retried(self, mock_once, mock_sleep):
+        from scripts.ole_stock_data import get_latest_bars
+
+        mock_once.return_value = {"data": [], "error": "Symbol 'X' not found in database."}
+        assert get_latest_bars("X")["error"].startswith("Symbol")
+        assert mock_once.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("win32com.client.Dispatch")
+    def test_connection_reused_across_requests(self, mock_dispatch):
+        from scripts.ole_stock_data import AMIBROKER_DB_PATH, get_latest_bars
+
+        app = self._app()
+        app.DatabasePath = AMIBROKER_DB_PATH
+        mock_dispatch.return_value = app
+
+        get_latest_bars("GCZ5", interval=300)
+        get_latest_bars("GCZ5", interval=60)
+
+        assert mock_dispatch.call_count == 1
+        assert app.Stocks.call_count == 1
+        app.LoadDatabase.assert_not_called()
+
+    @patch("win32com.client.Dispatch")
+    def test_failed_request_drops_pooled_connection(self, mock_dispatch):
+        from scripts.ole_stock_data import get_latest_bars
+
+        app = self._app()
+        mock_dispatch.return_value = app
+        app.Stocks.side_effect = Exception("RPC server unavailable")
+        assert get_latest_bars("GCZ5")["error"]
+
+        app.Stocks.side_effect = self._app().Stocks.side_effect
+        assert get_latest_bars("GCZ5")["error"] is None
+        assert mock_dispatch.call_count == 2
+
+    @patch("win32com.client.Dispatch")
+    def test_data_error_keeps_pooled_connection(self, mock_dispatch):
+        from scripts.ole_stock_data import get_latest_bars
+
+        mock_dispatch.return_value = self._app()
+        assert get_latest_bars("ESZ5")["error"] == "Symbol 'ESZ5' not found in database."
+        assert get_latest_bars("GCZ5")["error"] is None
+        assert mock_dispatch.call_count == 1
+
+    @patch("win32com.client.Dispatch")
+    def test_connection_owned_by_com_thread(self, mock_dispatch):
+        import threading
+        from scripts.ole_stock_data import get_latest_bars
+
+        threads = []
+
+        def _dispatch(*args):
+            threads.append(threading.current_thread().name)
+            return self._app()
+
+        mock_dispatch.side_effect = _dispatch
+        workers = [
+            threading.Thread(target=get_latest_bars, args=("GCZ5",)) for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert len(threads) == 1
+        assert threads[0].startswith("amibroker-com")
+
+    @patch("win32com.client.Dispatch")
+    def test_date_range_uses_pooled_connection(self, mock_dispatch, tmp_path):
+        import threading
+        import scripts.ole_stock_data as mod
+
+        threads = []
+
+        def _dispatch(*args):
+            threads.append(threading.current_thread().name)
+            return self._app()
+
+        mock_dispatch.side_effect = _dispatch
+        with patch.object(mod, "_DATE_RANGE_CACHE_PATH", tmp_path / "date_range.json"):
+            assert mod.get_latest_bars("GCZ5")["error"] is None
+            result = mod.get_dataset_date_range("GCZ5", refresh=True)
+
+        assert result == {"first_date": "2025-07-21", "last_date": "2025-07-21",
+                          "error": None, "stale": False}
+        assert len(threads) == 1
+        assert threads[0].startswith("amibroker-com")
+
+    @patch("win32com.client.Dispatch", side_effect=Exception("not running"))
+    def test_many_reports_amibroker_not_running(self, mock_dispatch):
+        from scripts.ole_stock_data import get_latest_bars_many
+
+        results = get_latest_bars_many(["GCZ5", "NQZ5"])
+        assert all("not running" in r["error"] for r in results.values())
+
+
+class TestBisectQuotations:
+    """Tests for the quotation binary search and its probe cache."""
+
+    def _quotations(self, n):
+        base = datetime(2025, 7, 21, 9, 0)
+        quotes = [
+            _make_mock_quotation(base + timedelta(minutes=i), 100, 101, 99, 100)
+            for i in range(n)
+        ]
+        quotations = MagicMock(side_effect=lambda i: quotes[i])
+        return quotations, base
+
+    def test_matches_linear_scan(self):
+        from scripts.ole_stock_data import StockDataFetcher
+
+        quotations, base = self._quotations(50)
+        for offset in (-5, 0, 17, 49, 60):
+            target = base + timedelta(minutes=offset)
+            expected = min(max(offset, 0), 49)
+            assert StockDataFetcher._bisect_quotations(quotations, 50, target) == expected
+
+    def test_matches_brute_force_with_duplicate_dates(self):
+        from scripts.ole_stock_data import StockDataFetcher
+
+        base = datetime(2025, 7, 21, 9, 0)
+        for count in range(1, 24):
+            # Tick data often repeats a timestamp -- the search must land on
+            # the first of a run.
+            dates = [base + timedelta(minutes=i // 3) for i in range(count)]
+            quotes = [_make_mock_quotation(dt, 100, 101, 99, 100) for dt in dates]
+            quotations = MagicMock(side_effect=lambda i: quotes[i])
+            for offset in range(-1, count // 3 + 2):
+                target = base + timedelta(minutes=offset)
+                expected = next(
+                    (i for i, dt in enumerate(dates) if dt >= target), count - 1
+                )
+                got = StockDataFetcher._bisect_quotations(quotations, count, target)
+                assert got == expected, (count, offset)
+
+    def test_window_outside_history_reads_only_endpoints(self):
+        from scripts.ole_stock_data import StockDataFetcher
+
+        quotations, base = self._quotations(1000)
+        before = base - timedelta(days=1)
+        after = base + timedelta(days=30)
+
+        assert StockDataFetcher._bisect_quotations(quotations, 1000, before) == 0
+        assert quotations.call_count == 1
+        assert StockDataFetcher._bisect_quotations(quotations, 1000, after) == 999
+        assert quotations.call_count == 3
+
+    def test_probe_cache_skips_repeat_com_reads(self):
+        from scripts.ole_stock_data import StockDataFetcher, _quotation_probes
+
+        quotations, base = self._quotations(1000)
+        last_dt = base + timedelta(minutes=999)
+        target = base + timedelta(minutes=321)
+
+        probes = _quotation_probes("GCZ5", 1000, last_dt)
+        assert StockDataFetcher._bisect_quotations(quotations, 1000, target, probes) == 321
+        first_calls = quotations.call_count
+
+        probes = _quotation_probes("GCZ5", 1000, last_dt)
+        assert StockDataFetcher._bisect_quotations(quotations, 1000, target, probes) == 321
+        assert first_calls > 0
+        assert quotations.call_count == first_calls
+
+    def test_probe_cache_resets_when_bars_appended(self):
+        from scripts.ole_stock_data import _quotation_probes
+
+        last_dt = datetime(2025, 7, 21, 16, 0)
+        probes = _quotation_probes("GCZ5", 100, last_dt)
+        probes[50] = datetime(2025, 7, 21, 12, 0)
+        assert 50 in _quotation_probes("GCZ5", 100, last_dt)
+        assert 50 not in _quotation_probes("GCZ5", 101, last_dt + timedelta(minutes=1))
+
+    def test_probe_cache_resets_on_database_load(self):
+        from scripts.ole_stock_data import StockDataFetcher, _quotation_probes
+
+        last_dt = datetime(2025, 7, 21, 16, 0)
+        _quotation_probes("GCZ5", 100, last_dt)[50] = datetime(2025, 7, 21, 12, 0)
+
+        fetcher = StockDataFetcher()
+        fetcher.ab = MagicMock()
+        fetcher.ab.DatabasePath = "C:/other/database"
+        assert fetcher.load_database("C:/amibroker/database") is True
+        fetcher.ab.LoadDatabase.assert_called_once()
+        assert 50 not in _quotation_probes("GCZ5", 100, last_dt)
+
+
 class TestDataIntervalDetection:
     """Tests for StockDataFetcher.detect_data_interval()."""
 
@@ -342,6 +1022,15 @@ class TestDataIntervalDetection:
         ]
         assert StockDataFetcher.detect_data_interval(bars) == 300
 
+    def test_detect_uses_upper_median(self):
+        """An even split of gaps resolves to the larger one, not their mean."""
+        from scripts.ole_stock_data import StockDataFetcher
+
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        offsets = [0, 60, 120, 420, 720]
+        ticks = [{"datetime": base + timedelta(seconds=o)} for o in offsets]
+        assert StockDataFetcher.detect_data_interval(ticks) == 300
+
     def test_detect_single_bar(self):
         """With only 1 data point, we can't detect — should return 0."""
         from scripts.ole_stock_data import StockDataFetcher
@@ -413,6 +1102,110 @@ class TestAggregateBars:
         assert bars[0]["open"] == 100
         assert bars[0]["volume"] == 600
 
+    def test_aggregate_unsorted_input(self):
+        """Out-of-order ticks are still sorted before aggregation."""
+        from scripts.ole_stock_data import StockDataFetcher
+
+        base = datetime(2025, 7, 21, 1, 14, 0)
+        ticks = [
+            {"datetime": base + timedelta(seconds=40), "open": 102, "high": 104, "low": 101, "close": 103, "volume": 20},
+            {"datetime": base + timedelta(seconds=0),  "open": 100, "high": 102, "low": 99,  "close": 101, "volume": 10},
+        ]
+        bars = StockDataFetcher._aggregate_bars(ticks, 60)
+        assert bars[0]["open"] == 100
+        assert bars[0]["close"] == 103
+
+    def test_aggregate_across_session_gap(self):
+        """A multi-day gap yields only the populated buckets."""
+        from scripts.ole_stock_data import StockDataFetcher, _epoch_seconds
+
+        friday = datetime(2025, 7, 18, 16, 58, 0)
+        monday = datetime(2025, 7, 21, 9, 30, 0)
+        ticks = [
+            {"datetime": dt, "open": 100.0 + i, "high": 101.0 + i,
+             "low": 99.0 + i, "close": 100.5 + i, "volume": 1.0}
+            for i, dt in enumerate([
+                friday, friday + timedelta(minutes=1, seconds=30),
+                monday, monday + timedelta(minutes=4),
+            ])
+        ]
+        bars = StockDataFetcher._aggregate_bars(ticks, 300)
+        assert [b["time"] for b in bars] == [
+            _epoch_seconds(datetime(2025, 7, 18, 16, 55)),
+            _epoch_seconds(datetime(2025, 7, 21, 9, 30)),
+        ]
+        assert bars[0]["open"] == 100.0 and bars[0]["close"] == 101.5
+        assert bars[1]["volume"] == 2.0
+
+    def test_aggregate_outlier_timestamp_stays_sparse(self):
+        """One stray decades-old tick must not inflate the bin grid."""
+        from scripts.ole_stock_data import StockDataFetcher, _epoch_seconds
+
+        stray = datetime(1990, 1, 2, 0, 0, 0)
+        base = datetime(2025, 7, 21, 9, 30, 0)
+        ticks = [
+            {"datetime": dt, "open": 100.0, "high": 100.0,
+             "low": 100.0, "close": 100.0, "volume": 1.0}
+            for dt in (stray, base, base + timedelta(seconds=1))
+        ]
+        # ~1.1e9 one-second bins between the outlier and the live data.
+        bars = StockDataFetcher._aggregate_bars(ticks, 1)
+        assert [b["time"] for b in bars] == [
+            _epoch_seconds(stray), _epoch_seconds(base), _epoch_seconds(base) + 1,
+        ]
+
+    def test_bucket_kernel_matches_groupby(self):
+        """The Numba path (when installed) must agree with pandas."""
+        pytest.importorskip("numba")
+        import scripts.ole_stock_data as mod
+
+        rng = np.random.default_rng(7)
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        offsets = np.sort(rng.integers(0, 3 * 3600, size=500))
+        prices = 3400 + rng.normal(size=500).cumsum().round(2)
+        ticks = [
+            {"datetime": base + timedelta(seconds=int(o)), "open": p, "high": p + 0.25,
+             "low": p - 0.25, "close": p, "volume": float(rng.integers(1, 9))}
+            for o, p in zip(offsets, prices)
+        ]
+        compiled = mod.StockDataFetcher._aggregate_bars(ticks, 300)
+        with patch.object(mod, "numba", None):
+            assert mod.StockDataFetcher._aggregate_bars(ticks, 300) == compiled
+
+    def test_aggregate_keeps_cent_grid_prices(self):
+        """Narrowing cent-grid prices for the resample must not disturb rounded output."""
+        from scripts.ole_stock_data import StockDataFetcher
+
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        for price in (3427.37, 131071.99, 250000.01):
+            ticks = [
+                {"datetime": base + timedelta(seconds=i * 20),
+                 "open": price, "high": price + 0.01, "low": price - 0.01,
+                 "close": price, "volume": 1e9 + 1}
+                for i in range(3)
+            ]
+            bar = StockDataFetcher._aggregate_bars(ticks, 60)[0]
+            assert bar["open"] == price
+            assert bar["high"] == round(price + 0.01, 2)
+            assert bar["low"] == round(price - 0.01, 2)
+            assert bar["volume"] == 3e9 + 3
+
+    def test_aggregate_half_cent_ties_match_float64(self):
+        """Off-grid quotes must round exactly as the float64 path does."""
+        from scripts.ole_stock_data import StockDataFetcher
+
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        prices = [1234.005 + 0.01 * k for k in range(200)]
+        ticks = [
+            {"datetime": base + timedelta(minutes=i),
+             "open": p, "high": p, "low": p, "close": p, "volume": 1.0}
+            for i, p in enumerate(prices)
+        ]
+        bars = StockDataFetcher._aggregate_bars(ticks, 60)
+        expected = np.round(np.array(prices), 2).tolist()
+        for f in ("open", "high", "low", "close"):
+            assert [bar[f] for bar in bars] == expected
+
     def test_format_bars_no_aggregation(self):
         """_format_bars should passthrough without resampling."""
         from scripts.ole_stock_data import StockDataFetcher
@@ -427,3 +1220,122 @@ class TestAggregateBars:
         bars = StockDataFetcher._format_bars(ticks)
         assert len(bars) == 5
         assert bars[0]["open"] == 100.0
+
+    def test_format_and_aggregate_share_time_convention(self):
+        """Bars at the source interval get the same epoch either way."""
+        from scripts.ole_stock_data import StockDataFetcher, _epoch_seconds
+
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        ticks = [
+            {"datetime": base + timedelta(minutes=i),
+             "open": 100.0, "high": 101.0, "low": 99.0,
+             "close": 100.5, "volume": 50.0}
+            for i in range(3)
+        ]
+        formatted = StockDataFetcher._format_bars(ticks)
+        aggregated = StockDataFetcher._aggregate_bars(ticks, 60)
+        assert formatted == aggregated
+        assert formatted[0]["time"] == _epoch_seconds(base)
+
+
+# ---------------------------------------------------------------------------
+# Columnar (SoA) layout tests
+# ---------------------------------------------------------------------------
+
+class TestColumnarLayout:
+    """Tests for the ``layout="soa"`` payload and its dict conversion."""
+
+    def _ticks(self):
+        base = datetime(2025, 7, 21, 1, 0, 0)
+        return [
+            {"datetime": base + timedelta(seconds=i * 20),
+             "open": 100.0 + i, "high": 101.0 + i, "low": 99.0 + i,
+             "close": 100.5 + i, "volume": 10.0}
+            for i in range(9)
+        ]
+
+    def test_aggregate_columns_matches_bars(self):
+        from scripts.ole_stock_data import StockDataFetcher, aos_from_soa
+
+        ticks = self._ticks()
+        columns = StockDataFetcher._aggregate_columns(ticks, 60)
+        assert aos_from_soa(columns) == StockDataFetcher._aggregate_bars(ticks, 60)
+
+    def test_format_columns_matches_bars(self):
+        from scripts.ole_stock_data import StockDataFetcher, aos_from_soa
+
+        ticks = self._ticks()
+        columns = StockDataFetcher._format_columns(ticks)
+        assert aos_from_soa(columns) == StockDataFetcher._format_bars(ticks)
+
+    @patch("win32com.client.Dispatch")
+    def test_fetch_ohlcv_soa(self, mock_dispatch):
+        from scripts.ole_stock_data import StockDataFetcher
+
+        base_dt = datetime(2025, 7, 21, 1, 14, 0)
+        ticks = [
+            _make_mock_quotation(base_dt + timedelta(seconds=0),  3427.0, 3427.5, 3426.5, 3427.2, 10),
+            _make_mock_quotation(base_dt + timedelta(seconds=20), 3427.2, 3428.0, 3427.0, 3427.8, 15),
+        ]
+        mock_app = MagicMock()
+        mock_app.Stocks.return_value = _make_mock_stock("GCZ5", ticks)
+        mock_dispatch.return_value = mock_app
+
+        fetcher = StockDataFetcher()
+        fetcher.connect()
+        result = fetcher.fetch_ohlcv(
+            "GCZ5", base_dt - timedelta(minutes=1), base_dt + timedelta(minutes=1),
+            layout="soa",
+        )
+
+        assert result["error"] is None
+        data = result["data"]
+        assert set(data) == {"time", "open", "high", "low", "close", "volume"}
+        assert data["open"].tolist() == [3427.0]
+        assert data["volume"].tolist() == [25.0]
+
+    def test_read_quotations_returns_tick_columns(self):
+        from scripts.ole_stock_data import StockDataFetcher, _tick_columns
+
+        ticks = self._ticks()
+        quotes = [
+            _make_mock_quotation(t["datetime"], t["open"], t["high"], t["low"],
+                                 t["close"], t["volume"])
+            for t in ticks
+        ]
+        quotations = MagicMock(side_effect=lambda i: quotes[i])
+
+        columns = StockDataFetcher._read_quotations(
+            quotations, 0, len(quotes), ticks[2]["datetime"], ticks[5]["datetime"],
+        )
+        expected = _tick_columns(ticks[2:6])
+        assert columns["datetime"].dtype == np.dtype("datetime64[us]")
+        for f in expected:
+            np.testing.assert_array_equal(columns[f], expected[f])
+
+    def test_read_quotations_accepts_pywintypes_dates(self):
+        """With CoInitialize, COM returns tz-aware datetimes instead of floats."""
+        from datetime import timezone
+        from scripts.ole_stock_data import StockDataFetcher
+
+        ticks = self._ticks()
+        quotes = []
+        for t in ticks:
+            q = MagicMock()
+            q.Date = t["datetime"].replace(tzinfo=timezone.utc)
+            q.Open, q.High, q.Low = t["open"], t["high"], t["low"]
+            q.Close, q.Volume = t["close"], t["volume"]
+            quotes.append(q)
+        quotations = MagicMock(side_effect=lambda i: quotes[i])
+
+        columns = StockDataFetcher._read_quotations(
+            quotations, 0, len(quotes), None, ticks[3]["datetime"],
+        )
+        assert columns["datetime"].tolist() == [t["datetime"] for t in ticks[:4]]
+        assert columns["open"].tolist() == [t["open"] for t in ticks[:4]]
+
+    def test_invalid_layout(self):
+        from scripts.ole_stock_data import StockDataFetcher
+
+        with pytest.raises(ValueError):
+            StockDataFetcher().fetch_ohlcv("GCZ5", datetime.now(), datetime.now(), layout="rows")
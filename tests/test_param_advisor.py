@@ -0,0 +1,227 @@
+"""Tests for scripts.param_advisor -- Param() optimization suggestions."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.param_advisor import (
+    _PARAM_RULES,
+    _classify_param,
+    _estimate_combinations,
+    _match_rule,
+    analyze_strategy_params,
+    clear_analysis_cache,
+    get_all_strategy_analysis,
+)
+
+
+def _param(name, default=10, vmin=1, vmax=200, step=1):
+    return {"name": name, "default": default, "min": vmin, "max": vmax, "step": step}
+
+
+# ---------------------------------------------------------------------------
+# Rule matching
+# ---------------------------------------------------------------------------
+
+class TestMatchRule:
+    def test_matches_linear_rule_scan(self):
+        """The combined regex picks the same rule as scanning rules in order."""
+        keywords = [kw for rule in _PARAM_RULES for kw in rule["keywords"]]
+        names = keywords + [
+            f"{a}_{b}" for a in keywords for b in keywords
+        ] + ["fast", "signal_level", "atrmultiplier", "stddevbars"]
+        for name in names:
+            expected = next(
+                (r for r in _PARAM_RULES if any(kw in name for kw in r["keywords"])),
+                None,
+            )
+            assert _match_rule(name) is expected, name
+            assert _match_rule(name.upper()) is expected, name
+
+    def test_atr_length_uses_first_defined_rule(self):
+        """'ATR_Length' hits both 'atr' and 'length'; the period rule is first."""
+        s = _classify_param(_param("ATR_Length"))
+        assert s["category"] == "period"
+        assert s["priority"] == "high"
+        assert s["suggested_range"] == [5, 100]
+
+    def test_unmatched_param_is_other(self):
+        s = _classify_param(_param("Fast", step=2))
+        assert s["category"] == "other"
+        assert s["suggested_step"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Combination estimate
+# ---------------------------------------------------------------------------
+
+class TestEstimateCombinations:
+    def test_counts_grid_points(self):
+        suggestions = [
+            _classify_param(_param("Fast_Length", vmin=5, vmax=50)),  # 10 steps
+            _classify_param(_param("ADX_Threshold", vmin=10, vmax=40)),  # 7 steps
+        ]
+        est = _estimate_combinations(suggestions)
+        assert est["total_combinations"] == 70
+        assert est["estimated_time_seconds"] == 175
+        assert est["overflow"] is False
+
+    def test_runaway_grid_reports_overflow(self):
+        suggestions = [
+            {"param_name": f"Band{i}", "priority": "high",
+             "suggested_range": [0, 100], "suggested_step": 0.01}
+            for i in range(4)
+        ]  # 10001 steps each -> ~1e16 combinations
+        est = _estimate_combinations(suggestions)
+        assert est["overflow"] is True
+        assert est["total_combinations"] is None
+        assert est["estimated_time_seconds"] is None
+        assert len(est["params_to_optimize"]) == 4
+
+
+# ---------------------------------------------------------------------------
+# Portfolio analysis
+# ---------------------------------------------------------------------------
+
+class TestAllStrategyAnalysis:
+    def test_keeps_strategy_order_and_drops_errors(self):
+        strategies = [{"id": f"s{i}"} for i in range(20)]
+
+        def fake_analyze(strategy_id):
+            if strategy_id == "s3":
+                return {"error": "No versions found for strategy: s3"}
+            return {"strategy_id": strategy_id}
+
+        with patch("scripts.strategy_db.list_strategies", return_value=strategies), \
+                patch("scripts.param_advisor.analyze_strategy_params", side_effect=fake_analyze):
+            results = get_all_strategy_analysis(max_workers=4)
+
+        assert [r["strategy_id"] for r in results] == [
+            s["id"] for s in strategies if s["id"] != "s3"
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Analysis cache
+# ---------------------------------------------------------------------------
+
+class TestAnalysisCache:
+    AFL = 'len = Param("Fast_Length", 10, 2, 50, 1);\n'
+
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self):
+        clear_analysis_cache()
+        yield
+        clear_analysis_cache()
+
+    @pytest.fixture
+    def latest(self):
+        """Patch both latest-version lookups to serve ``latest.version``."""
+        class Latest:
+            version = None
+
+        state = Latest()
+        with patch("scripts.param_advisor.get_latest_version",
+                   side_effect=lambda sid: state.version) as get_version, \
+                patch("scripts.param_advisor.get_latest_version_id",
+                      side_effect=lambda sid: state.version and state.version["id"]):
+            state.get_version = get_version
+            yield state
+
+    def _version(self, version_id, afl=None):
+        return {"id": version_id, "version_number": 1,
+                "afl_content": self.AFL if afl is None else afl}
+
+    def test_reuses_analysis_until_version_changes(self, latest):
+        strategy = {"id": "s1", "name": "Demo"}
+        latest.version = self._version("v1")
+        with patch("scripts.param_advisor.get_strategy", return_value=strategy) as get_strategy:
+            first = analyze_strategy_params("s1")
+            second = analyze_strategy_params("s1")
+            assert second == first and second is not first
+            assert get_strategy.call_count == 1
+            # A hit never loads the full version row (and its AFL).
+            assert latest.get_version.call_count == 1
+
+            latest.version = self._version("v2")
+            assert analyze_strategy_params("s1")["version_id"] == "v2"
+            assert get_strategy.call_count == 2
+
+            clear_analysis_cache()
+            analyze_strategy_params("s1")
+            assert get_strategy.call_count == 3
+
+    def test_new_version_evicts_older_entries(self, latest):
+        from scripts import param_advisor
+
+        with patch("scripts.param_advisor.get_strategy",
+                   side_effect=lambda sid: {"id": sid, "name": "Demo"}):
+            for version_id in ("v1", "v2", "v3"):
+                latest.version = self._version(version_id)
+                analyze_strategy_params("s1")
+            analyze_strategy_params("s2")
+
+        assert sorted(param_advisor._ANALYSIS_CACHE) == [("s1", "v3"), ("s2", "v3")]
+
+    def test_callers_cannot_mutate_cached_analysis(self, latest):
+        strategy = {"id": "s1", "name": "Demo"}
+        latest.version = self._version("v1")
+        with patch("scripts.param_advisor.get_strategy", return_value=strategy):
+            first = analyze_strategy_params("s1")
+            expected_params = [dict(p) for p in first["params"]]
+            first["params"][0]["name"] = "changed"
+            first["suggestions"].clear()
+
+            second = analyze_strategy_params("s1")
+            assert second["params"] == expected_params
+            assert second["suggestions"]
+            second["params"].clear()
+            assert analyze_strategy_params("s1")["params"] == expected_params
+
+    def test_errors_are_not_cached(self, latest):
+        with patch("scripts.param_advisor.get_strategy", return_value=None):
+            assert "error" in analyze_strategy_params("missing")
+        latest.version = self._version("v1", afl="")
+        with patch("scripts.param_advisor.get_strategy",
+                   return_value={"id": "s1", "name": "Demo"}) as get_strategy:
+            assert "error" in analyze_strategy_params("s1")
+            assert "error" in analyze_strategy_params("s1")
+            assert get_strategy.call_count == 2
+
+            clear_analysis_cache()
+            analyze_strategy_params("s1")
+            assert get_strategy.call_count == 3
+
+    def test_callers_cannot_mutate_cached_analysis(self):
+        strategy = {"id": "s1", "name": "Demo"}
+        with patch("scripts.param_advisor.get_strategy", return_value=strategy), \
+                patch("scripts.param_advisor.get_latest_version",
+                      return_value=self._version("v1")):
+            first = analyze_strategy_params("s1")
+            expected_params = [dict(p) for p in first["params"]]
+            first["params"][0]["name"] = "changed"
+            first["suggestions"].clear()
+
+            second = analyze_strategy_params("s1")
+            assert second["params"] == expected_params
+            assert second["suggestions"]
+            second["params"].clear()
+            assert analyze_strategy_params("s1")["params"] == expected_params
+
+    def test_errors_are_not_cached(self):
+        with patch("scripts.param_advisor.get_strategy", return_value=None), \
+                patch("scripts.param_advisor.get_latest_version", return_value=None):
+            assert "error" in analyze_strategy_params("missing")
+        with patch("scripts.param_advisor.get_strategy",
+                   return_value={"id": "s1", "name": "Demo"}) as get_strategy, \
+                patch("scripts.param_advisor.get_latest_version",
+                      return_value={"id": "v1", "version_number": 1, "afl_content": ""}):
+            assert "error" in analyze_strategy_params("s1")
+            assert "error" in analyze_strategy_params("s1")
+            assert get_strategy.call_count == 2
@@ -0,0 +1,52 @@
+"""Tests for scripts.param_info -- parameter and indicator tooltips."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.param_info import INDICATOR_INFO, PARAM_INFO, ParamDoc, get_param_info
+
+
+class TestParamInfo:
+    def test_is_read_only(self):
+        with pytest.raises(TypeError):
+            PARAM_INFO["New Param"] = {}
+        with pytest.raises(AttributeError):
+            PARAM_INFO["TEMA Length"].typical = ""
+
+    def test_get_param_info(self):
+        name = "".join(["TEMA ", "Length"])  # not the interned literal
+        assert get_param_info(name) is PARAM_INFO["TEMA Length"]
+        assert get_param_info("No Such Param") is None
+
+    def test_aliases_share_canonical_entry(self):
+        assert PARAM_INFO["SD Multiplier"] is PARAM_INFO["StdDev Multiplier"]
+        assert PARAM_INFO["Entry Sigma"] is PARAM_INFO["Entry Band Sigma"]
+
+    def test_entry_schema_is_enforced(self):
+        with pytest.raises(TypeError):
+            ParamDoc(indicator="", math="", param="", typcial="", guidance="")
+        assert all(
+            set(info) == {"name", "description", "math", "usage", "key_params"}
+            for info in INDICATOR_INFO.values()
+        )
+
+    def test_seed_param_tooltips(self, tmp_path):
+        from scripts.strategy_db import (
+            get_all_param_tooltips_dict,
+            init_db,
+            seed_param_tooltips,
+        )
+
+        db = tmp_path / "strategies.db"
+        init_db(db)
+        # init_db may seed already; either way every entry ends up stored.
+        seed_param_tooltips(db)
+        stored = get_all_param_tooltips_dict(db)
+        assert set(PARAM_INFO) <= set(stored)
+        assert stored["ADX Period"] == PARAM_INFO["ADX Period"]._asdict()
@@ -25,6 +25,7 @@ from scripts.strategy_db import (
     get_version,
     list_versions,
     get_latest_version,
+    get_latest_version_id,
     create_run,
     update_run,
     get_run,
@@ -158,6 +159,13 @@ class TestVersionCrud:
         sid = create_strategy(name="S", db_path=db)
         assert get_latest_version(sid, db) is None
 
+    def test_get_latest_version_id(self, db):
+        sid = create_strategy(name="S", db_path=db)
+        assert get_latest_version_id(sid, db) is None
+        create_version(sid, afl_content="v1", db_path=db)
+        vid = create_version(sid, afl_content="v2", db_path=db)
+        assert get_latest_version_id(sid, db) == vid
+
 
 # ---------------------------------------------------------------------------
 # Run CRUD